@@ -7,17 +7,133 @@ Description: This script processes and filters results from Dirsearch 、Feroxbu
 """
 
 import sys
-import re
-from urllib.parse import urljoin
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QHBoxLayout, QLabel, QLineEdit, QPushButton, QTabWidget,
-    QTextEdit, QMessageBox, QComboBox, QStackedWidget, QTableWidget, QTableWidgetItem, QHeaderView
+    QTextEdit, QMessageBox, QComboBox, QStackedWidget, QTableWidget, QTableWidgetItem, QHeaderView, QTableView,
+    QFileDialog, QCheckBox
 )
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 
-from filter.dirsearch import filter as dirsearch_filter # dirsearch 处理
-from filter.feroxbuster import filter_response_data  # 导入 Feroxbuster 的过滤函数
+from filter.dirsearch import iter_filter as dirsearch_filter  # dirsearch 处理
+from filter.feroxbuster import iter_response_data  # 导入 Feroxbuster 的过滤函数
 from filter.fscan import process_fscan_data     # fscan 处理
+from filter.aggregate import FscanRollup, WebRollup  # 按主机汇总
+from filter.registry import parsers, get_parser, detect, iter_text_lines  # 其他扫描器格式
+from filter.bigtext import TextBuffer, LARGE_TEXT_CHARS  # 大数据输入
+from filter.topk import VIEW_MODES, select_view, format_stats  # Top N / 抽样显示
+from filter.dirsearch import UNIT_MULTIPLIER
+from filter.urlnorm import join_url, resolve_redirect, dedup_key, unique  # URL 规范化和去重
+
+
+class RecordTableModel(QAbstractTableModel):
+    """按注册表中格式的字段显示记录, 视图需要时才生成单元格内容"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.keys = []
+        self.labels = []
+        self.records = []
+
+    def set_records(self, spec, records):
+        self.beginResetModel()
+        self.keys = spec.keys
+        self.labels = spec.labels
+        self.records = records
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            value = self.records[index.row()].get(self.keys[index.column()])
+            return '' if value is None else str(value)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self.labels):
+            return self.labels[section]
+        return super().headerData(section, orientation, role)
+
+
+class LargeTextEdit(QTextEdit):
+    """输入框, 大段粘贴和打开的文件保存在 TextBuffer 中, 输入框只显示预览, 不加载全部文本"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAcceptRichText(False)  # 只接受纯文本, 避免富文本排版
+        self.buffer = None
+
+    def canInsertFromMimeData(self, source):
+        return source.hasUrls() or super().canInsertFromMimeData(source)
+
+    def insertFromMimeData(self, source):
+        files = [url.toLocalFile() for url in source.urls() if url.isLocalFile()] if source.hasUrls() else []
+        if files:
+            self.load_file(files[0])
+            return
+        if source.hasText():
+            text = source.text()
+            if len(text) > LARGE_TEXT_CHARS:
+                self.set_buffer(TextBuffer.from_text(text))
+                return
+        super().insertFromMimeData(source)
+
+    # 拖入文件时直接打开, 只读状态下也可以拖入新文件替换
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            super().dragEnterEvent(event)
+
+    def dragMoveEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            super().dragMoveEvent(event)
+
+    def dropEvent(self, event):
+        if event.mimeData().hasUrls():
+            self.insertFromMimeData(event.mimeData())
+            event.acceptProposedAction()
+        else:
+            super().dropEvent(event)
+
+    def open_file(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "打开文件", "", "文本文件 (*.txt *.log *.json *.jsonl *.csv);;所有文件 (*)")
+        if file_name:
+            self.load_file(file_name)
+
+    def load_file(self, file_name):
+        try:
+            self.set_buffer(TextBuffer.from_file(file_name))
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "错误", f"无法打开文件: {e}")
+
+    def set_buffer(self, buffer):
+        if self.buffer is not None:
+            self.buffer.close()
+        self.buffer = buffer
+        self.setReadOnly(True)
+        self.setPlainText(f"[已载入 {buffer.size / 1024 ** 2:.1f} MB 数据, 编码 {buffer.encoding}, "
+                          f"以下仅为开头的预览, 过滤时读取完整数据, 点击\"清空\"恢复编辑]\n\n" + buffer.preview())
+
+    def clear_input(self):
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+        self.setReadOnly(False)
+        self.clear()
+
+    def input_lines(self):
+        return self.buffer.iter_lines() if self.buffer is not None else iter_text_lines(self.toPlainText())
+
+    def input_sample(self):
+        return self.buffer.sample() if self.buffer is not None else self.toPlainText()
 
 
 class FilterApp(QMainWindow):
@@ -74,14 +190,20 @@ class FilterApp(QMainWindow):
         self.dirsearch_button = QPushButton("Dirsearch")
         self.feroxbuster_button = QPushButton("Feroxbuster")
         self.fscan_button = QPushButton("Fscan")
+        self.formats_button = QPushButton("更多格式")
+        self.summary_button = QPushButton("汇总")
 
         self.dirsearch_button.clicked.connect(self.show_dirsearch_page)
         self.feroxbuster_button.clicked.connect(self.show_feroxbuster_page)
         self.fscan_button.clicked.connect(self.show_fscan_page)
+        self.formats_button.clicked.connect(self.show_formats_page)
+        self.summary_button.clicked.connect(self.show_summary_page)
 
         self.switch_button_layout.addWidget(self.dirsearch_button)
         self.switch_button_layout.addWidget(self.feroxbuster_button)
         self.switch_button_layout.addWidget(self.fscan_button)
+        self.switch_button_layout.addWidget(self.formats_button)
+        self.switch_button_layout.addWidget(self.summary_button)
 
         # 添加 QStackedWidget 用于不同页面
         self.central_widget = QStackedWidget()
@@ -101,6 +223,16 @@ class FilterApp(QMainWindow):
         self.setup_fscan_page()  # 确保在创建 Fscan 页面时调用
         self.central_widget.addWidget(self.fscan_page)
 
+        # 汇总页面
+        self.summary_page = QWidget()
+        self.setup_summary_page()
+        self.central_widget.addWidget(self.summary_page)
+
+        # 其他格式页面 (ffuf、gobuster、nuclei 等, 由注册表提供)
+        self.formats_page = QWidget()
+        self.setup_formats_page()
+        self.central_widget.addWidget(self.formats_page)
+
         # 将按钮布局和 QStackedWidget 添加到主布局
         self.main_layout.addLayout(self.switch_button_layout)
         self.main_layout.addWidget(self.central_widget)
@@ -114,8 +246,8 @@ class FilterApp(QMainWindow):
 
         # 输入数据框
         self.data_input_label_fscan = QLabel("输入Fscan结果:")
-        self.data_input_fscan = QTextEdit()
-        layout.addWidget(self.data_input_label_fscan)
+        self.data_input_fscan = LargeTextEdit()
+        layout.addLayout(self.input_header(self.data_input_label_fscan, self.data_input_fscan))
         layout.addWidget(self.data_input_fscan)
 
         # 处理按钮
@@ -127,6 +259,44 @@ class FilterApp(QMainWindow):
         self.tab_widget_fscan = QTabWidget()
         layout.addWidget(self.tab_widget_fscan)
 
+    def input_header(self, label, edit):
+        # 输入框上方一行: 标签、打开文件和清空按钮
+        header_layout = QHBoxLayout()
+        open_button = QPushButton("打开文件…")
+        open_button.clicked.connect(edit.open_file)
+        clear_button = QPushButton("清空")
+        clear_button.clicked.connect(edit.clear_input)
+        header_layout.addWidget(label)
+        header_layout.addStretch()
+        header_layout.addWidget(open_button)
+        header_layout.addWidget(clear_button)
+        return header_layout
+
+    def view_controls(self):
+        # 结果太多时的显示方式: 全部、Top N、最罕见、随机抽样
+        view_layout = QHBoxLayout()
+        mode_input = QComboBox()
+        for mode, title in VIEW_MODES:
+            mode_input.addItem(title, mode)
+        count_input = QLineEdit("1000")
+        dedup_input = QCheckBox("按 URL 去重")  # 百分号编码、主机大小写不同的同一路径只保留一条
+        view_layout.addWidget(QLabel("显示方式:"))
+        view_layout.addWidget(mode_input)
+        view_layout.addWidget(QLabel("N:"))
+        view_layout.addWidget(count_input)
+        view_layout.addWidget(dedup_input)
+        view_layout.addStretch()
+        return view_layout, mode_input, count_input, dedup_input
+
+    def view_mode(self, mode_input, count_input):
+        try:
+            count = int(count_input.text() or 1000)
+        except ValueError:
+            raise ValueError("显示数量 N 必须为整数。")
+        if count <= 0:
+            raise ValueError("显示数量 N 必须大于 0。")
+        return mode_input.currentData(), count
+
     def show_dirsearch_page(self):
         self.central_widget.setCurrentIndex(0)
 
@@ -136,13 +306,100 @@ class FilterApp(QMainWindow):
     def show_fscan_page(self):
         self.central_widget.setCurrentIndex(2)
 
+    def show_summary_page(self):
+        self.central_widget.setCurrentIndex(3)
+
+    def show_formats_page(self):
+        self.central_widget.setCurrentIndex(4)
+
+    def setup_formats_page(self):
+        layout = QVBoxLayout(self.formats_page)
+
+        # 格式选择, 默认根据输入内容自动识别
+        format_layout = QHBoxLayout()
+        self.format_label = QLabel("格式:")
+        self.format_input = QComboBox()
+        self.format_input.addItem("自动识别", None)
+        for spec in parsers():
+            self.format_input.addItem(spec.title, spec.name)
+        format_layout.addWidget(self.format_label)
+        format_layout.addWidget(self.format_input)
+        format_layout.addStretch()
+        layout.addLayout(format_layout)
+
+        # 输入数据框
+        self.data_input_label_formats = QLabel("输入待过滤的数据:")
+        self.data_input_formats = LargeTextEdit()
+        self.data_input_formats.setPlaceholderText("支持 " + "、".join(spec.title for spec in parsers()) + " 的输出")
+        layout.addLayout(self.input_header(self.data_input_label_formats, self.data_input_formats))
+        layout.addWidget(self.data_input_formats)
+
+        # 值过滤、路径过滤和大小范围放在一行
+        filter_layout = QHBoxLayout()
+        self.value_filter_label_formats = QLabel("状态码/等级 (用逗号分隔):")
+        self.value_filter_input_formats = QLineEdit()
+        filter_layout.addWidget(self.value_filter_label_formats)
+        filter_layout.addWidget(self.value_filter_input_formats)
+
+        self.formats_filter_path_label = QLabel("正则提取路径:")
+        self.formats_filter_path_input = QLineEdit()
+        filter_layout.addWidget(self.formats_filter_path_label)
+        filter_layout.addWidget(self.formats_filter_path_input)
+
+        self.formats_size_label = QLabel("响应大小 (字节):")
+        self.formats_min_size_input = QLineEdit()
+        self.formats_max_size_input = QLineEdit()
+        filter_layout.addWidget(self.formats_size_label)
+        filter_layout.addWidget(self.formats_min_size_input)
+        filter_layout.addWidget(QLabel("到"))
+        filter_layout.addWidget(self.formats_max_size_input)
+        layout.addLayout(filter_layout)
+
+        # 过滤按钮
+        self.filter_button_formats = QPushButton("过滤")
+        self.filter_button_formats.clicked.connect(self.filter_results_formats)
+        layout.addWidget(self.filter_button_formats)
+
+        # 表格输出, 使用 model/view, 不为每个单元格创建控件
+        self.result_model_formats = RecordTableModel(self)
+        self.result_table_formats = QTableView()
+        self.result_table_formats.setModel(self.result_model_formats)
+        self.result_table_formats.setAlternatingRowColors(True)
+        layout.addWidget(self.result_table_formats)
+
+    def setup_summary_page(self):
+        layout = QVBoxLayout(self.summary_page)
+
+        # 每次过滤时按主机汇总, 每个工具一个标签页, 显示最近一次的结果
+        self.summary_label = QLabel("按主机汇总最近一次的处理结果:")
+        layout.addWidget(self.summary_label)
+        self.tab_widget_summary = QTabWidget()
+        layout.addWidget(self.tab_widget_summary)
+        self.summary_tables = {}
+
+    def update_summary(self, name, rollup):
+        rows = rollup.rows()
+        table_widget = self.summary_tables.get(name)
+        if table_widget is None:
+            table_widget = QTableWidget()
+            self.summary_tables[name] = table_widget
+            self.tab_widget_summary.addTab(table_widget, name)
+
+        table_widget.setRowCount(len(rows) - 1)
+        table_widget.setColumnCount(len(rows[0]))
+        table_widget.setHorizontalHeaderLabels(rows[0])
+        for row in range(1, len(rows)):
+            for col, value in enumerate(rows[row]):
+                table_widget.setItem(row - 1, col, QTableWidgetItem(value))
+        table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+
     def setup_dirsearch_page(self):
         layout = QVBoxLayout(self.dirsearch_page)
 
         # 输入数据框
         self.data_input_label = QLabel("输入待过滤的数据:")
-        self.data_input = QTextEdit()
-        layout.addWidget(self.data_input_label)
+        self.data_input = LargeTextEdit()
+        layout.addLayout(self.input_header(self.data_input_label, self.data_input))
         layout.addWidget(self.data_input)
 
         # 状态码输入
@@ -173,10 +430,16 @@ class FilterApp(QMainWindow):
         layout.addWidget(self.dirsearch_filter_path_label)
         layout.addWidget(self.dirsearch_filter_path_input)
 
+        # 显示方式
+        view_layout, self.dirsearch_view_mode_input, self.dirsearch_view_count_input, self.dirsearch_dedup_input = self.view_controls()
+        layout.addLayout(view_layout)
+
         # 过滤按钮
         self.filter_button = QPushButton("过滤")
         self.filter_button.clicked.connect(self.filter_results_dirsearch)
         layout.addWidget(self.filter_button)
+        self.dirsearch_stats_label = QLabel()
+        layout.addWidget(self.dirsearch_stats_label)
 
         # 表格输出
         self.result_table = QTableWidget()
@@ -189,8 +452,8 @@ class FilterApp(QMainWindow):
 
         # 输入数据框
         self.data_input_label_ferox = QLabel("输入待过滤的数据:")
-        self.data_input_ferox = QTextEdit()
-        layout.addWidget(self.data_input_label_ferox)
+        self.data_input_ferox = LargeTextEdit()
+        layout.addLayout(self.input_header(self.data_input_label_ferox, self.data_input_ferox))
         layout.addWidget(self.data_input_ferox)
 
         # 状态码、请求方法和过滤路径输入放在一行
@@ -244,10 +507,16 @@ class FilterApp(QMainWindow):
 
         layout.addLayout(count_layout)
 
+        # 显示方式
+        view_layout, self.ferox_view_mode_input, self.ferox_view_count_input, self.ferox_dedup_input = self.view_controls()
+        layout.addLayout(view_layout)
+
         # 过滤按钮
         self.filter_button_ferox = QPushButton("过滤")
         self.filter_button_ferox.clicked.connect(self.filter_results_feroxbuster)
         layout.addWidget(self.filter_button_ferox)
+        self.ferox_stats_label = QLabel()
+        layout.addWidget(self.ferox_stats_label)
 
         # 表格输出
         self.result_table_ferox = QTableWidget()
@@ -261,9 +530,9 @@ class FilterApp(QMainWindow):
 
         # 输入数据框
         self.data_input_label_fscan = QLabel("输入Fscan结果:")
-        self.data_input_fscan = QTextEdit()
+        self.data_input_fscan = LargeTextEdit()
         self.data_input_fscan.setPlaceholderText("在此输入Fscan结果\n数据处理逻辑, 参考于 ZororoZ师傅的 https://github.com/ZororoZ/fscanOutput 😀")
-        layout.addWidget(self.data_input_label_fscan)
+        layout.addLayout(self.input_header(self.data_input_label_fscan, self.data_input_fscan))
         layout.addWidget(self.data_input_fscan)
 
         # 处理按钮
@@ -276,7 +545,7 @@ class FilterApp(QMainWindow):
         layout.addWidget(self.tab_widget_fscan)
 
     def filter_results_dirsearch(self):
-        output_str = self.data_input.toPlainText()
+        output_lines = self.data_input.input_lines()
         status_codes = [sc.strip() for sc in self.dirsearch_status_code_input.text().split(',') if sc.strip()]
         min_size = self.dirsearch_min_size_input.text()
         max_size = self.dirsearch_max_size_input.text()
@@ -294,22 +563,28 @@ class FilterApp(QMainWindow):
             QMessageBox.critical(self, "错误", "最小和最大大小必须为数字。")
             return
 
-        target_url = ""
-        for line in output_str.splitlines():
-            if "Target:" in line:
-                match = re.search(r'Target:\s+(http[^\s]+)', line)
-                if match:
-                    target_url = match.group(1)
-                    break
-
-            if 'dirsearch' in line or 'DIRSEARCH' in line:
-                match = re.search(r'dirsearch\.?p?y?[ ]+-u\s+(http[^\s]+)', line)
-                if match:
-                    target_url = match.group(1)
-                    break
+        # 目标地址 (Target: 或 -o 报告开头的 dirsearch -u 行) 在过滤时逐行识别, 保存在 state 中
+        state = {}
 
         try:
-            filtered_results = dirsearch_filter(output_str, status_codes, (min_size, max_size, size_unit), filter_path)
+            view_mode, view_count = self.view_mode(self.dirsearch_view_mode_input, self.dirsearch_view_count_input)
+            rollup = WebRollup()
+            results = dirsearch_filter(output_lines, status_codes, (min_size, max_size, size_unit), filter_path,
+                                       rollup=rollup, state=state)
+            if self.dirsearch_dedup_input.isChecked():
+                # 终端输出和 -o 报告同时粘贴时同一路径会出现两次
+                results = unique(results, key=lambda r: dedup_key(join_url(state.get('target_url', ''), r[4])))
+            filtered_results, stats = select_view(
+                results, view_mode, view_count,
+                size_key=lambda r: int(r[2]) * UNIT_MULTIPLIER[r[3]],
+                status_key=lambda r: r[1],
+                signature_key=lambda r: (r[1], r[2] + r[3]),
+            )
+            target_url = state.get('target_url', '')
+            if target_url:
+                rollup.set_base_url(target_url)
+            self.update_summary("Dirsearch", rollup)
+            self.dirsearch_stats_label.setText(format_stats(stats, len(filtered_results)))
 
             self.result_table.setRowCount(0)
 
@@ -322,7 +597,9 @@ class FilterApp(QMainWindow):
                 redirect_path = result[5] if len(result) > 4 else '无'
 
                 # 直接使用原始路径而不改变单位
-                complete_path = urljoin(target_url, path)
+                complete_path = join_url(target_url, path)
+                # 与 Feroxbuster、接收服务一致, 跳转目标相对完整路径补全
+                redirect_path = resolve_redirect(complete_path, redirect_path)
 
                 row_position = self.result_table.rowCount()
                 self.result_table.insertRow(row_position)
@@ -340,7 +617,7 @@ class FilterApp(QMainWindow):
             QMessageBox.critical(self, "错误", str(e))
 
     def filter_results_feroxbuster(self):
-        output_str = self.data_input_ferox.toPlainText()
+        output_lines = self.data_input_ferox.input_lines()
         status_codes = [sc.strip() for sc in self.status_code_input_ferox.text().split(',') if sc.strip()]
         methods = [m.strip().upper() for m in self.method_input_ferox.text().split(',') if m.strip()]
 
@@ -366,15 +643,29 @@ class FilterApp(QMainWindow):
         path_regex = self.feroxbuster_filter_path_input.text().strip() or None
 
         try:
-            filtered_results = filter_response_data(
-                output_str,
+            view_mode, view_count = self.view_mode(self.ferox_view_mode_input, self.ferox_view_count_input)
+            rollup = WebRollup()
+            results = iter_response_data(
+                output_lines,
                 methods=methods,
                 line_count=line_count,
                 word_count=word_count,
                 byte_count=byte_count,
                 path_regex=path_regex,  # 添加路径过滤
-                status_codes=status_codes
+                status_codes=status_codes,
+                rollup=rollup
+            )
+            if self.ferox_dedup_input.isChecked():
+                results = unique(results, key=lambda r: (r['method'], dedup_key(r['url'])))
+            # 逐条选取, 只保留要显示的记录
+            filtered_results, stats = select_view(
+                results, view_mode, view_count,
+                size_key=lambda r: r['bytes'],
+                status_key=lambda r: r['status_code'],
+                signature_key=lambda r: (r['status_code'], r['lines'], r['words'], r['bytes']),
             )
+            self.update_summary("Feroxbuster", rollup)
+            self.ferox_stats_label.setText(format_stats(stats, len(filtered_results)))
 
             self.result_table_ferox.setRowCount(0)
 
@@ -412,11 +703,13 @@ class FilterApp(QMainWindow):
             QMessageBox.critical(self, "错误", str(e))
 
     def filter_results_fscan(self):
-        output_str = self.data_input_fscan.toPlainText()
+        output_lines = self.data_input_fscan.input_lines()
 
         try:
             # 调用处理函数并获取结果
-            processed_results = process_fscan_data(output_str)
+            rollup = FscanRollup()
+            processed_results = process_fscan_data(output_lines, rollup=rollup)
+            self.update_summary("Fscan", rollup)
 
             # 清空之前的 tab_widget 内容
             self.tab_widget_fscan.clear()
@@ -429,8 +722,9 @@ class FilterApp(QMainWindow):
                     table_widget.setColumnCount(len(data[0]))
 
                     for row in range(1, len(data)):  # 从1开始跳过表头
-                        for col in range(len(data[row])):
-                            table_widget.setItem(row - 1, col, QTableWidgetItem(str(data[row][col])))
+                        values = data[row]  # 行在访问时才从紧凑存储中生成, 每行只取一次
+                        for col in range(len(values)):
+                            table_widget.setItem(row - 1, col, QTableWidgetItem(str(values[col])))
 
                     table_widget.setHorizontalHeaderLabels(data[0])  # 设置表头为数据的第一行
 
@@ -450,6 +744,44 @@ class FilterApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "错误", str(e))
 
+    def filter_results_formats(self):
+        values = [v.strip() for v in self.value_filter_input_formats.text().split(',') if v.strip()]
+        path_regex = self.formats_filter_path_input.text().strip() or None
+        min_size = self.formats_min_size_input.text().strip()
+        max_size = self.formats_max_size_input.text().strip()
+
+        try:
+            size_range = (int(min_size) if min_size else None, int(max_size) if max_size else None)
+        except ValueError:
+            QMessageBox.critical(self, "错误", "最小和最大大小必须为整数。")
+            return
+
+        name = self.format_input.currentData()
+        spec = get_parser(name) if name else detect(self.data_input_formats.input_sample())
+        if spec is None:
+            QMessageBox.critical(self, "错误", "无法识别输入数据的格式, 请手动选择。")
+            return
+        self.data_input_label_formats.setText(f"输入待过滤的数据 (格式: {spec.title}):")
+
+        try:
+            # Web 扫描类的格式同时按主机汇总
+            rollup = WebRollup() if {'url', 'status_code', 'bytes'} <= set(spec.keys) else None
+            records = []
+            for record in spec.filter(spec.parse(self.data_input_formats.input_lines()), values, path_regex, size_range):
+                records.append(record)
+                if rollup is not None:
+                    rollup.add(record['url'], record['status_code'], record['bytes'])
+
+            self.result_model_formats.set_records(spec, records)
+            self.result_table_formats.resizeColumnsToContents()
+            if rollup is not None:
+                self.update_summary(spec.title, rollup)
+
+            if not records:
+                QMessageBox.information(self, "结果", "没有符合条件的结果。")
+        except Exception as e:
+            QMessageBox.critical(self, "错误", str(e))
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,229 @@
+# coding: utf-8
+"""
+Description: 按主机汇总扫描结果。解析时逐条调用 add() 累加到以主机为键的字典中,
+             不需要在解析完成后再遍历一遍结果。
+
+    FscanRollup  fscan 各分类结果: 开放端口、OS、服务、标题、弱口令、漏洞、NetBios
+    WebRollup    dirsearch / Feroxbuster 结果按 URL 主机分组: 状态码分布、响应大小
+
+用法:
+    python -m filter.aggregate fscan result.txt
+    python -m filter.aggregate feroxbuster ferox.txt --format csv
+    python -m filter.aggregate dirsearch dirsearch.txt --target http://127.0.0.1/ --format json
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from filter.urlnorm import join_url, scheme_end
+
+UNKNOWN_HOST = '(unknown)'
+
+
+def url_host(url):
+    # 取 URL 中的主机 (含端口) 并转为小写, 比 urlsplit 快, 汇总时每条结果都要调用
+    # 相对路径 (包括参数中带完整 URL 的 /r?u=http://x/) 返回空字符串
+    start = scheme_end(url)
+    if start < 0:
+        return ''
+    rest = url[start + 3:]
+    for sep in '/?#':
+        end = rest.find(sep)
+        if end >= 0:
+            rest = rest[:end]
+    return rest.rpartition('@')[2].lower()
+
+
+def _strip_port(host):
+    if host.startswith('['):
+        return host[:host.find(']') + 1]
+    return host.partition(':')[0]
+
+
+class FscanHost:
+    __slots__ = ('ports', 'os', 'services', 'titles', 'weak_creds', 'vulns', 'netbios')
+
+    def __init__(self):
+        self.ports = set()
+        self.os = ''
+        self.services = set()
+        self.titles = []
+        self.weak_creds = []
+        self.vulns = []
+        self.netbios = ''
+
+
+class FscanRollup:
+    """fscan 结果按主机汇总, add() 的参数与 iter_fscan_records 产出的 (分类, 字段) 一致"""
+
+    header = ['Host', 'Open Ports', 'Ports', 'OS', 'Services', 'Titles', 'Weak Creds', 'Vulns', 'NetBios']
+
+    def __init__(self):
+        self.hosts = {}
+        self.counts = {}
+
+    def _url_key(self, url):
+        # URL 类结果去掉端口, 与按 IP 记录的结果归到同一主机
+        return _strip_port(url_host(url)) or UNKNOWN_HOST
+
+    def _host(self, key):
+        host = self.hosts.get(key)
+        if host is None:
+            host = self.hosts[key] = FscanHost()
+        return host
+
+    def add(self, category, fields):
+        self.counts[category] = self.counts.get(category, 0) + 1
+
+        if category == 'OpenPort':
+            self._host(fields[0]).ports.add(fields[1])
+        elif category == 'OsList':
+            host = self._host(fields[0])
+            if fields[1] and not host.os:
+                host.os = fields[1]
+        elif category == 'Bug_ExpList':
+            self._host(fields[0]).vulns.append(fields[1])
+        elif category == 'Bug_PocList':
+            self._host(self._url_key(fields[0])).vulns.append(fields[1])
+        elif category == 'Title':
+            self._host(self._url_key(fields[0])).titles.append(fields[3].strip())
+        elif category == 'WeakPasswd':
+            host = self._host(fields[0])
+            host.services.add(fields[1])
+            host.weak_creds.append(f"{fields[1]} {fields[2]}".strip())
+        elif category == 'Finger':
+            self._host(self._url_key(fields[0])).services.add(fields[1])
+        elif category == 'NetBios':
+            self._host(fields[0]).netbios = fields[1]
+        elif category == 'NetInfo':
+            self._host(fields[0])
+
+    def rows(self):
+        rows = [list(self.header)]
+        for key, host in self.hosts.items():
+            ports = sorted(host.ports, key=lambda p: (len(p), p))
+            rows.append([
+                key,
+                str(len(ports)),
+                ','.join(ports),
+                host.os,
+                ', '.join(sorted(host.services)),
+                ' | '.join(dict.fromkeys(host.titles)),
+                str(len(host.weak_creds)),
+                ', '.join(dict.fromkeys(host.vulns)),
+                host.netbios,
+            ])
+        return rows
+
+
+class WebHost:
+    __slots__ = ('total', 'status', 'bytes', 'max_size')
+
+    def __init__(self):
+        self.total = 0
+        self.status = {}
+        self.bytes = 0
+        self.max_size = 0
+
+
+class WebRollup:
+    """dirsearch / Feroxbuster 结果按 URL 主机汇总, 相对路径通过 base_url 补全"""
+
+    header = ['Host', 'Total', 'Status Codes', 'Total Size', 'Max Size']
+
+    def __init__(self, base_url=''):
+        self.base_url = base_url
+        self.hosts = {}
+        self.status = {}
+        self.total = 0
+
+    def add(self, url, status_code, size):
+        if scheme_end(url) < 0 and self.base_url:
+            url = join_url(self.base_url, url)
+        key = url_host(url) or UNKNOWN_HOST
+
+        host = self.hosts.get(key)
+        if host is None:
+            host = self.hosts[key] = WebHost()
+        host.total += 1
+        host.status[status_code] = host.status.get(status_code, 0) + 1
+        host.bytes += size
+        if size > host.max_size:
+            host.max_size = size
+
+        self.total += 1
+        self.status[status_code] = self.status.get(status_code, 0) + 1
+
+    def set_base_url(self, base_url):
+        """目标地址在部分结果之后才识别到时调用, 之前无法补全的相对路径归入目标主机"""
+        self.base_url = base_url
+        key = url_host(base_url)
+        pending = self.hosts.get(UNKNOWN_HOST)
+        if not key or pending is None:
+            return
+        del self.hosts[UNKNOWN_HOST]
+        host = self.hosts.get(key)
+        if host is None:
+            host = self.hosts[key] = WebHost()
+        host.total += pending.total
+        for status_code, count in pending.status.items():
+            host.status[status_code] = host.status.get(status_code, 0) + count
+        host.bytes += pending.bytes
+        host.max_size = max(host.max_size, pending.max_size)
+
+    def rows(self):
+        rows = [list(self.header)]
+        for key, host in self.hosts.items():
+            histogram = ' '.join(f"{code}:{count}" for code, count in sorted(host.status.items()))
+            rows.append([key, str(host.total), histogram, str(host.bytes), str(host.max_size)])
+        return rows
+
+
+def _print_rows(rows, fmt, out):
+    if fmt == 'csv':
+        csv.writer(out).writerows(rows)
+    elif fmt == 'json':
+        header = rows[0]
+        json.dump([dict(zip(header, row)) for row in rows[1:]], out, ensure_ascii=False, indent=2)
+        out.write('\n')
+    else:
+        widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]))]
+        for row in rows:
+            out.write('  '.join(value.ljust(width) for value, width in zip(row, widths)).rstrip() + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="按主机汇总扫描结果")
+    parser.add_argument('tool', choices=('fscan', 'dirsearch', 'feroxbuster'))
+    parser.add_argument('file')
+    parser.add_argument('--format', choices=('text', 'csv', 'json'), default='text')
+    parser.add_argument('--target', default='', help="dirsearch 的目标地址, 用于补全相对路径, 默认从输出中的 Target: 识别")
+    parser.add_argument('--encoding', default='utf-8')
+    args = parser.parse_args()
+
+    with open(args.file, encoding=args.encoding, errors='replace') as f:
+        if args.tool == 'fscan':
+            from filter.fscan import iter_fscan_records
+            rollup = FscanRollup()
+            for category, fields in iter_fscan_records(f):
+                rollup.add(category, fields)
+        elif args.tool == 'dirsearch':
+            from filter.dirsearch import parse_lines
+            # parse_lines 从 Target: 或 dirsearch -u 行识别目标地址, 记录中的 url 已经补全
+            rollup = WebRollup(args.target)
+            state = {'target_url': args.target} if args.target else None
+            for record in parse_lines(f, state):
+                rollup.add(record['url'], record['status_code'], record['bytes'])
+        else:
+            from filter.feroxbuster import parse_lines
+            rollup = WebRollup()
+            for record in parse_lines(f):
+                rollup.add(record['url'], record['status_code'], record['bytes'])
+
+    _print_rows(rollup.rows(), args.format, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
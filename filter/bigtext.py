@@ -0,0 +1,82 @@
+# coding: utf-8
+"""
+Description: 大数据输入缓冲。超过阈值的粘贴内容写入临时文件, 打开的文件直接映射,
+             界面中只显示开头的预览, 解析时按行从文件读取, 不经过输入框。
+"""
+
+import mmap
+import os
+import tempfile
+
+import chardet
+
+LARGE_TEXT_CHARS = 2 * 1024 * 1024  # 粘贴超过这么多字符时改用缓冲
+PREVIEW_BYTES = 64 * 1024  # 预览和编码检测只看开头这么多字节
+PREVIEW_LINES = 200
+
+
+def _detect_encoding(sample):
+    if not sample:
+        return 'utf-8'
+    encoding = chardet.detect(sample)['encoding'] or 'utf-8'
+    # 样本只是文件开头, ascii 往往只是因为前面没有中文, 按 utf-8 读取
+    if encoding.lower() in ('ascii', 'utf-8'):
+        return 'utf-8'
+    return encoding
+
+
+class TextBuffer:
+    """文件形式保存的输入数据, 用 mmap 读取预览和样本, 按行迭代时以文本方式流式读取"""
+
+    def __init__(self, path, encoding=None, temporary=False):
+        self.path = path
+        self.temporary = temporary
+        self.size = os.path.getsize(path)
+        self._file = open(path, 'rb')
+        # 空文件不能 mmap
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.encoding = encoding or _detect_encoding(self._head())
+
+    @classmethod
+    def from_text(cls, text):
+        fd, path = tempfile.mkstemp(prefix='corgi_', suffix='.txt')
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        return cls(path, encoding='utf-8', temporary=True)
+
+    @classmethod
+    def from_file(cls, path, encoding=None):
+        return cls(path, encoding=encoding)
+
+    def _head(self, size=PREVIEW_BYTES):
+        return self._map[:size] if self._map is not None else b''
+
+    def sample(self, size=PREVIEW_BYTES):
+        """开头的一段文本, 用于识别格式"""
+        return self._head(size).decode(self.encoding, 'replace')
+
+    def preview(self, max_lines=PREVIEW_LINES):
+        lines = self.sample().splitlines()[:max_lines]
+        return '\n'.join(lines)
+
+    def iter_lines(self):
+        with open(self.path, encoding=self.encoding, errors='replace', newline='') as f:
+            for line in f:
+                yield line.rstrip('\r\n')
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        # Windows 下文件仍被映射时不能删除, 所以先关闭再删除
+        if self.temporary and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -1,12 +1,64 @@
 import re
 
+from filter.registry import ParserSpec, register, sniff_ratio
+from filter.urlnorm import join_url, resolve_redirect, split_redirect
+
+# 终端输出: [09:45:52] 200 -    1KB - /Desktop.ini  ->  /redirect
+LOG_PATTERN = re.compile(r'\[(\d{2}:\d{2}:\d{2})\]\s*(\d{3})\s*-\s*(\d+)\s*(B|KB|MB|GB)\s*-\s*(.+?\s*-?>?\s*.+)?')
+# -o 报告: 200     1KB  http://127.0.0.1/Desktop.ini    -> REDIRECTS TO: /redirect
+REPORT_PATTERN = re.compile(r'(\d{3})\s+(\d+)\s*(B|KB|MB|GB)\s+(http[^\s]+)\s*(->\s*REDIRECTS TO:\s*(.+))?')
+TARGET_PATTERN = re.compile(r'Target:\s+(http[^\s]+)')
+COMMAND_PATTERN = re.compile(r'dirsearch\.?p?y?[ ]+-u\s+(http[^\s]+)')
+TIME_PREFIX_PATTERN = re.compile(r'\[\d{2}:\d{2}:\d{2}\]')
+UNIT_MULTIPLIER = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
 
-def filter(output_str: str, status_codes: list = None, size_filter: tuple = None, path_regex: str = None):
-    if status_codes is None:
-        status_codes = []
 
+def filter(output_str: str, status_codes: list = None, size_filter: tuple = None, path_regex: str = None, rollup=None):
     if not isinstance(output_str, str):
         raise ValueError("output_str must be a string.")
+    status_codes, min_bytes, max_bytes = _check_filter(status_codes, size_filter)
+    matches = (match for pattern in (LOG_PATTERN, REPORT_PATTERN) for match in pattern.findall(output_str))
+    return list(_filter_matches(matches, status_codes, size_filter, min_bytes, max_bytes, path_regex, rollup))
+
+
+def iter_filter(lines, status_codes: list = None, size_filter: tuple = None, path_regex: str = None, rollup=None,
+                state=None):
+    """
+    与 filter 相同, 但逐行匹配、逐条产出, 用于大文件缓冲之类按行读取的输入
+    结果按行的先后顺序, filter 则是先终端输出再 -o 报告
+    读取过程中识别 Target: 或 dirsearch -u 行, 目标地址保存在 state['target_url'] 中,
+    之后的结果按它补全后交给 rollup; 用法与 parse_lines 的 state 相同
+    """
+    status_codes, min_bytes, max_bytes = _check_filter(status_codes, size_filter)
+    state = {} if state is None else state
+    matches = (match for line in _track_target(lines, state)
+               for pattern in (LOG_PATTERN, REPORT_PATTERN) for match in pattern.findall(line))
+    return _filter_matches(matches, status_codes, size_filter, min_bytes, max_bytes, path_regex, rollup, state)
+
+
+def _track_target(lines, state):
+    for line in lines:
+        if not state.get('target_url'):
+            match = TARGET_PATTERN.search(line) or COMMAND_PATTERN.search(line)
+            if match:
+                state['target_url'] = match.group(1)
+        yield line
+
+
+def find_target(lines):
+    """输出中的目标地址: Target: 行或 dirsearch -u 命令行, 找不到时返回空字符串"""
+    for line in lines:
+        match = TARGET_PATTERN.search(line) or COMMAND_PATTERN.search(line)
+        if match:
+            return match.group(1)
+    return ''
+
+
+def _check_filter(status_codes, size_filter):
+    # 参数校验, 返回 (状态码列表, 最小字节数, 最大字节数)
+    if status_codes is None:
+        status_codes = []
+
     if not isinstance(status_codes, list) or not all(isinstance(code, str) for code in status_codes):
         raise ValueError("status_codes must be a list of strings.")
     if size_filter is not None and (not isinstance(size_filter, tuple) or len(size_filter) != 3):
@@ -32,44 +84,103 @@ def filter(output_str: str, status_codes: list = None, size_filter: tuple = None
             raise ValueError("unit must be one of: 'B', 'KB', 'MB', 'GB'.")
         min_bytes = min_size * unit_multiplier.get(unit, 1)
         max_bytes = max_size * unit_multiplier.get(unit, float('inf'))
-    patterns = [
-        r'\[(\d{2}:\d{2}:\d{2})\]\s*(\d{3})\s*-\s*(\d+)\s*(B|KB|MB|GB)\s*-\s*(.+?\s*-?>?\s*.+)?',
-        r'(\d{3})\s+(\d+)\s*(B|KB|MB|GB)\s+(http[^\s]+)\s*(->\s*REDIRECTS TO:\s*(.+))?'
-    ]
-
-    filtered = []
-    for pattern in patterns:
-        matches = re.findall(pattern, output_str)
-        for match in matches:
-            if len(match) == 5:  # 第一个模式
-                time, status, size, size_unit, path = match
-                if '->' in path:
-                    path = path.split('->')[0].strip()
-                    redirect_path = ''.join(path.split('->')[::])
-                else:
-                    redirect_path = ''
-            elif len(match) == 6:  # 第二个模式
-                time = ''
-                status, size, size_unit, path = match[:4]
-                redirect_path = match[5] if match[5] else ''
-            else:
-                print("长度不一致")
-                print(len(match), match)
-
-            # 确保 size 是数字
-            try:
-                size_bytes = int(size) * unit_multiplier[size_unit]
-            except (ValueError, KeyError):
-                continue  # 跳过该匹配
-
-            # 路径正则匹配
-            if path_regex and not re.search(path_regex, path, re.IGNORECASE):
+    return status_codes, min_bytes, max_bytes
+
+
+def _filter_matches(matches, status_codes, size_filter, min_bytes, max_bytes, path_regex, rollup, state=None):
+    # 对 LOG_PATTERN / REPORT_PATTERN 的 findall 结果逐条过滤
+    for match in matches:
+        if len(match) == 5:  # 第一个模式
+            time, status, size, size_unit, path = match
+            path, redirect_path = split_redirect(path)
+        elif len(match) == 6:  # 第二个模式
+            time = ''
+            status, size, size_unit, path = match[:4]
+            redirect_path = match[5] if match[5] else ''
+        else:
+            print("长度不一致")
+            print(len(match), match)
+
+        # 确保 size 是数字
+        try:
+            size_bytes = int(size) * UNIT_MULTIPLIER[size_unit]
+        except (ValueError, KeyError):
+            continue  # 跳过该匹配
+
+        # 路径正则匹配
+        if path_regex and not re.search(path_regex, path, re.IGNORECASE):
+            continue
+
+        if (not status_codes or status in status_codes) and (size_filter is None or min_bytes <= size_bytes <= max_bytes):
+            if rollup is not None:  # 边过滤边按主机汇总
+                target_url = state.get('target_url', '') if state else ''
+                rollup.add(join_url(target_url, path.strip()) if target_url else path.strip(), status, size_bytes)
+            yield (time, status, size, size_unit, path.strip(), redirect_path.strip())
+
+
+def parse_lines(lines, state=None):
+    """
+    逐行解析 dirsearch 的终端输出和 -o 报告, 产出记录字典
+    state 的用法与 gobuster.parse_lines 相同, 其中预先给出的 target_url 优先于输出中的 Target:
+    """
+    state = {} if state is None else state
+    target_url = state.get('target_url', '')
+    for line in lines:
+        line = line.strip()
+        if not target_url:
+            match = TARGET_PATTERN.search(line) or COMMAND_PATTERN.search(line)
+            if match:
+                target_url = state['target_url'] = match.group(1)
                 continue
 
-            if (not status_codes or status in status_codes) and (size_filter is None or min_bytes <= size_bytes <= max_bytes):
-                filtered.append((time, status, size, size_unit, path.strip(), redirect_path.strip()))
-
-    return filtered
+        match = LOG_PATTERN.search(line)
+        if match:
+            time, status, size, size_unit, path = match.groups()
+            path, redirect_path = split_redirect(path or '')
+            url = join_url(target_url, path)
+        else:
+            match = REPORT_PATTERN.search(line)
+            if not match:
+                continue
+            time = ''
+            status, size, size_unit, url, _, redirect_path = match.groups()
+            path = url
+            url = join_url('', url)
+
+        yield {
+            'time': time,
+            'status_code': status,
+            'bytes': int(size) * UNIT_MULTIPLIER[size_unit],
+            'path': path,
+            'redirect_url': resolve_redirect(url, (redirect_path or '').strip()),
+            'url': url,
+        }
+
+
+def sniff(sample):
+    return sniff_ratio(sample, lambda line: bool(
+        TIME_PREFIX_PATTERN.match(line) or REPORT_PATTERN.match(line) or
+        line.startswith(('Target:', 'Task Completed', '# Dirsearch started'))))
+
+
+register(ParserSpec(
+    'dirsearch', 'Dirsearch',
+    columns=(
+        ('time', '时间', str),
+        ('status_code', '状态码', str),
+        ('bytes', '响应大小', int),
+        ('path', '路径', str),
+        ('redirect_url', '跳转路径', str),
+        ('url', '完整路径', str),
+    ),
+    sniff=sniff,
+    parse=parse_lines,
+    patterns={'log': LOG_PATTERN, 'report': REPORT_PATTERN, 'target': TARGET_PATTERN},
+    value_field='status_code',
+    text_field='path',
+    size_field='bytes',
+    stateful=True,
+))
 
 
 if __name__ == '__main__':
@@ -1,14 +1,22 @@
 import re
 
+from filter.registry import ParserSpec, register, sniff_ratio
+from filter.urlnorm import normalize_url, resolve_redirect
 
-def filter_response_data(output_str, methods: list = None, line_count: tuple = None, word_count: tuple = None, byte_count: tuple = None, path_regex: str = None, status_codes: list = None):
-    filtered_results = []
+# 200      GET        5l       31w      408c http://127.0.0.1/ => http://127.0.0.1/redirect
+RESPONSE_PATTERN = re.compile(r'(\d{3})\s+(\w+)\s+(\d+)l\s+(\d+)w\s+(\d+)c\s+(http[^\s]+)(?:\s*=>\s*(http[^\s]+))?')
 
-    # 更新正则表达式以支持提取跳转路径
-    pattern = re.compile(r'(\d{3})\s+(\w+)\s+(\d+)l\s+(\d+)w\s+(\d+)c\s+(http[^\s]+)(?:\s*=>\s*(http[^\s]+))?')
 
-    for line in output_str.splitlines():
-        match = pattern.match(line.strip())
+def filter_response_data(output_str, methods: list = None, line_count: tuple = None, word_count: tuple = None, byte_count: tuple = None, path_regex: str = None, status_codes: list = None, rollup=None):
+    return list(iter_response_data(output_str, methods, line_count, word_count, byte_count, path_regex, status_codes, rollup))
+
+
+def iter_response_data(output_str, methods: list = None, line_count: tuple = None, word_count: tuple = None, byte_count: tuple = None, path_regex: str = None, status_codes: list = None, rollup=None):
+    # 与 filter_response_data 相同, 逐条产出结果, 用于 Top N / 抽样等不需要保留全部结果的场景
+    # 也可以传入按行迭代的对象, 如大文件缓冲
+    lines = output_str.splitlines() if isinstance(output_str, str) else output_str
+    for line in lines:
+        match = RESPONSE_PATTERN.match(line.strip())
         if not match:
             continue
 
@@ -17,8 +25,8 @@ def filter_response_data(output_str, methods: list = None, line_count: tuple = N
         l_count = int(match.group(3))
         w_count = int(match.group(4))
         b_count = int(match.group(5))
-        url = match.group(6)
-        redirect_url = match.group(7) if match.group(7) else None
+        url = normalize_url(match.group(6))
+        redirect_url = resolve_redirect(url, match.group(7)) if match.group(7) else None
 
         # 过滤请求方法
         if methods and method not in methods:
@@ -44,7 +52,9 @@ def filter_response_data(output_str, methods: list = None, line_count: tuple = N
         if path_regex and not re.search(path_regex, url, re.IGNORECASE):
             continue
 
-        filtered_results.append({
+        if rollup is not None:  # 边过滤边按主机汇总
+            rollup.add(url, status_code, b_count)
+        yield {
             'status_code': status_code,
             'method': method,
             'lines': l_count,
@@ -52,9 +62,48 @@ def filter_response_data(output_str, methods: list = None, line_count: tuple = N
             'bytes': b_count,
             'url': url,
             'redirect_url': redirect_url
-        })
+        }
+
+
+def parse_lines(lines):
+    """逐行解析 Feroxbuster 输出, 产出记录字典"""
+    for line in lines:
+        match = RESPONSE_PATTERN.match(line.strip())
+        if match:
+            url = normalize_url(match.group(6))
+            yield {
+                'status_code': match.group(1),
+                'method': match.group(2),
+                'lines': int(match.group(3)),
+                'words': int(match.group(4)),
+                'bytes': int(match.group(5)),
+                'url': url,
+                'redirect_url': resolve_redirect(url, match.group(7)),
+            }
+
+
+def sniff(sample):
+    return sniff_ratio(sample, lambda line: bool(RESPONSE_PATTERN.match(line)))
+
 
-    return filtered_results
+register(ParserSpec(
+    'feroxbuster', 'Feroxbuster',
+    columns=(
+        ('status_code', '状态码', str),
+        ('bytes', '响应大小', int),
+        ('url', '路径', str),
+        ('redirect_url', '跳转路径', str),
+        ('lines', '行数', int),
+        ('words', '字数', int),
+        ('method', '请求方法', str),
+    ),
+    sniff=sniff,
+    parse=parse_lines,
+    patterns={'response': RESPONSE_PATTERN},
+    value_field='status_code',
+    text_field='url',
+    size_field='bytes',
+))
 
 if __name__ == '__main__':
     # 使用示例
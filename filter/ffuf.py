@@ -0,0 +1,115 @@
+import json
+import re
+
+from filter.registry import ParserSpec, register, sniff_ratio
+
+# 终端输出: admin                   [Status: 301, Size: 169, Words: 5, Lines: 8, Duration: 12ms]
+RESULT_PATTERN = re.compile(r'^(\S.*?)\s+\[Status:\s*(\d{3}),\s*Size:\s*(\d+),\s*Words:\s*(\d+),\s*Lines:\s*(\d+)')
+ANSI_PATTERN = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+
+
+def _json_record(result):
+    fuzz_input = result.get('input') or {}
+    return {
+        'input': ' '.join(str(v) for k, v in fuzz_input.items() if k != 'FFUFHASH'),
+        'status_code': str(result.get('status', '')),
+        'bytes': int(result.get('length', 0)),
+        'words': int(result.get('words', 0)),
+        'lines': int(result.get('lines', 0)),
+        'url': result.get('url', ''),
+        'redirect_url': result.get('redirectlocation', ''),
+    }
+
+
+def _text_record(line):
+    match = RESULT_PATTERN.match(ANSI_PATTERN.sub('', line).strip())
+    if not match:
+        return None
+    # 终端输出里没有完整 URL, 用 FUZZ 的值代替, 便于按路径过滤
+    return {
+        'input': match.group(1),
+        'status_code': match.group(2),
+        'bytes': int(match.group(3)),
+        'words': int(match.group(4)),
+        'lines': int(match.group(5)),
+        'url': match.group(1),
+        'redirect_url': '',
+    }
+
+
+def parse_lines(lines):
+    """解析 ffuf 的 -of json 文件、逐行 JSON 和终端输出, 产出记录字典"""
+    lines = iter(lines)
+    for first in lines:
+        if first.strip():
+            break
+    else:
+        return
+
+    if not first.lstrip().startswith('{'):
+        for line in (first, *lines):
+            record = _text_record(line)
+            if record:
+                yield record
+        return
+
+    try:
+        obj = json.loads(first)
+    except ValueError:
+        obj = None
+    if obj is not None and 'results' not in obj:
+        # 每行一条结果
+        for line in (first, *lines):
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(result, dict) and 'status' in result:
+                yield _json_record(result)
+        return
+
+    # -of json 输出的是一个完整的 JSON 文档
+    document = obj if obj is not None else json.loads('\n'.join((first, *lines)))
+    for result in document.get('results') or []:
+        yield _json_record(result)
+
+
+def sniff(sample):
+    head = sample.lstrip()[:4096]
+    if head.startswith('{') and '"commandline"' in head:
+        return 1.0
+    return sniff_ratio(sample, lambda line: bool(
+        RESULT_PATTERN.match(ANSI_PATTERN.sub('', line)) or
+        (line.startswith('{') and '"status"' in line and '"input"' in line) or
+        line.startswith(':: ') or set(line) == {'_'}))
+
+
+register(ParserSpec(
+    'ffuf', 'ffuf',
+    columns=(
+        ('status_code', '状态码', str),
+        ('bytes', '响应大小', int),
+        ('url', '路径', str),
+        ('redirect_url', '跳转路径', str),
+        ('input', 'FUZZ', str),
+        ('lines', '行数', int),
+        ('words', '字数', int),
+    ),
+    sniff=sniff,
+    parse=parse_lines,
+    patterns={'result': RESULT_PATTERN},
+    value_field='status_code',
+    text_field='url',
+    size_field='bytes',
+    streaming=False,
+))
+
+
+if __name__ == '__main__':
+    output_data = """{"commandline":"ffuf -u http://127.0.0.1/FUZZ -w words.txt -of json -o out.json","time":"2024-10-01T09:45:35+08:00","results":[
+{"input":{"FFUFHASH":"a1","FUZZ":"admin"},"position":1,"status":301,"length":169,"words":5,"lines":8,"content-type":"text/html","redirectlocation":"http://127.0.0.1/admin/","url":"http://127.0.0.1/admin","host":"127.0.0.1"},
+{"input":{"FFUFHASH":"a2","FUZZ":"robots.txt"},"position":2,"status":200,"length":24,"words":3,"lines":2,"content-type":"text/plain","redirectlocation":"","url":"http://127.0.0.1/robots.txt","host":"127.0.0.1"}
+]}"""
+
+    for entry in parse_lines(output_data.splitlines()):
+        print(entry)
@@ -1,103 +1,191 @@
 import re
 import chardet
 
-
-def process_fscan_data(fscan_data):
-    results = {
-        'OpenPort': [['IP', 'Port']],
-        'OsList': [['IP', 'OS']],
-        'Bug_ExpList': [['IP', 'Bug Exp']],
-        'Bug_PocList': [['URL', 'Bug Poc']],
-        'Title': [['URL', 'Code', 'Length', 'Title']],
-        'WeakPasswd': [['IP', 'Server', 'Password']],
-        'Finger': [['URL', 'Finger']],
-        'NetInfo': [['IP', 'Netinfo']],
-        'NetBios': [['IP', 'NetBios']]
-    }
-    datalist = [_.strip() for _ in fscan_data.split('\n')]
-
-    def NetInfos():
-        info_n = re.findall(r'(.*NetInfo.*\n.*(\n.*\[->].*)+)', fscan_data)
-        for i in info_n:
-            ip = re.findall(r'\[\*](\d+\.\d+\.\d+\.\d+)', i[0])
-            netinfo_get = re.findall(r'((\n?.*\[->].*)+)', i[0])
-            netinfo = netinfo_get[0][0]
-            results['NetInfo'].append([ip[0], netinfo])
-
-    NetInfos()
-
-    for line in datalist:
-        # 处理 OpenPort
-        p = re.findall(r'^\d[^\s]+', line)
-        if p:
-            ip = re.findall(r"\d+\.\d+\.\d+\.\d+", p[0])
-            port = re.findall("(?<=:)\d+", p[0])
-            if ip and port:
-                results['OpenPort'].append([ip[0], port[0]])
-
-        # 处理 OsList
-        p = re.findall(r"\[\*]\s\d+\.\d+\.\d+\.\d+.*", line)
-        if p:
-            ip = re.findall(r"\d+\.\d+\.\d+\.\d+", p[0])
-            os_info = p[0].split(ip[0])[1].strip()
-            if ip:
-                results['OsList'].append([ip[0], os_info])
-
-        # 处理 Bug_ExpList
-        p = re.findall(r"\[\+]\s\d+\.\d+\.\d+\.\d+.*", line)
-        if p:
-            ip = re.findall(r"\d+\.\d+\.\d+\.\d+", p[0])
-            bug = p[0].split(ip[0])[1].strip()
-            if ip:
-                results['Bug_ExpList'].append([ip[0], bug])
-
-        # 处理 Bug_PocList
-        p = re.findall(r"\[\+].*poc-yaml[^\s].*", line)
-        if p:
-            for u in p:
-                url = re.findall(r"(?P<url>https?://\S+)", u)
-                bug = re.findall(r"poc-yaml.*", u)
-
-                if url and bug:
-                    results['Bug_PocList'].append([url[0], bug[0]])
-
-        # 处理 Title
-        p = re.findall(r'\[\*]\sWebTitle.*', line)
-        if p:
-            url = re.findall(r"http[^\s]+", p[0])
-            code = re.findall(r'(?<=code:)[^\s]+', p[0])
-            length = re.findall(r'(?<=len:)[^\s]+', p[0])
-            title = re.findall(r'(?<=title:).*', p[0])
-            if url and code and length and title:
-                results['Title'].append([url[0], code[0], length[0], title[0]])
-
-        # 处理 WeakPasswd
-        p = re.findall(r'((ftp|mysql|mssql|SMB|RDP|Postgres|SSH|oracle|SMB2-shares)(:|\s).*)', line, re.I)
-        if p:
-            ip = re.findall(r"\d+\.\d+\.\d+\.\d+", line)
-            if ip:
-                details = p[0][0].split(":")
-                server = details[0]
-                port = details[2] if len(details) > 2 else ''
-                passwd = details[3] if len(details) > 3 else ''
-                results['WeakPasswd'].append([ip[0], server, passwd])
-
-        # 处理 Finger
-        p = re.findall(r'.*InfoScan.*', line)
-        if p:
-            url = re.findall(r'http[^\s]+', p[0])
-            if url:
-                finger = p[0].split(url[0])[-1].strip()
-                results['Finger'].append([url[0], finger])
-
-        # 处理 NetBios
-        if "NetBios" in line:
-            ip = re.findall(r'\d+\.\d+\.\d+\.\d+', line)
-            netbios_info = line.split("NetBios")[-1].strip()
-            if ip:
-                results['NetBios'].append([ip[0], netbios_info])
-
-    return results
+from filter.fscan_store import FscanStore
+from filter.registry import ParserSpec, register, sniff_ratio, iter_text_lines
+
+IP_PATTERN = re.compile(r"\d+\.\d+\.\d+\.\d+")
+OPENPORT_PATTERN = re.compile(r'^\d[^\s]+')
+PORT_PATTERN = re.compile(r"(?<=:)\d+")
+OSLIST_PATTERN = re.compile(r"\[\*]\s\d+\.\d+\.\d+\.\d+.*")
+BUG_EXP_PATTERN = re.compile(r"\[\+]\s\d+\.\d+\.\d+\.\d+.*")
+BUG_POC_PATTERN = re.compile(r"\[\+].*poc-yaml[^\s].*")
+POC_URL_PATTERN = re.compile(r"https?://\S+")
+POC_NAME_PATTERN = re.compile(r"poc-yaml.*")
+TITLE_PATTERN = re.compile(r'\[\*]\sWebTitle.*')
+URL_PATTERN = re.compile(r"http[^\s]+")
+CODE_PATTERN = re.compile(r'(?<=code:)[^\s]+')
+LENGTH_PATTERN = re.compile(r'(?<=len:)[^\s]+')
+TITLE_TEXT_PATTERN = re.compile(r'(?<=title:).*')
+WEAKPASSWD_PATTERN = re.compile(r'((ftp|mysql|mssql|SMB|RDP|Postgres|SSH|oracle|SMB2-shares)(:|\s).*)', re.I)
+NETINFO_IP_PATTERN = re.compile(r'\[\*](\d+\.\d+\.\d+\.\d+)')
+IP_PORT_PATTERN = re.compile(r'\d+\.\d+\.\d+\.\d+:\d+')
+
+
+def _parse_line(line):
+    # 处理 OpenPort
+    p = OPENPORT_PATTERN.search(line)
+    if p:
+        ip = IP_PATTERN.search(p.group())
+        port = PORT_PATTERN.search(p.group())
+        if ip and port:
+            yield 'OpenPort', (ip.group(), port.group())
+
+    # 处理 OsList
+    p = OSLIST_PATTERN.search(line)
+    if p:
+        ip = IP_PATTERN.search(p.group()).group()
+        yield 'OsList', (ip, p.group().split(ip)[1].strip())
+
+    # 处理 Bug_ExpList
+    p = BUG_EXP_PATTERN.search(line)
+    if p:
+        ip = IP_PATTERN.search(p.group()).group()
+        yield 'Bug_ExpList', (ip, p.group().split(ip)[1].strip())
+
+    # 处理 Bug_PocList
+    p = BUG_POC_PATTERN.search(line)
+    if p:
+        url = POC_URL_PATTERN.search(p.group())
+        bug = POC_NAME_PATTERN.search(p.group())
+        if url and bug:
+            yield 'Bug_PocList', (url.group(), bug.group())
+
+    # 处理 Title
+    p = TITLE_PATTERN.search(line)
+    if p:
+        url = URL_PATTERN.search(p.group())
+        code = CODE_PATTERN.search(p.group())
+        length = LENGTH_PATTERN.search(p.group())
+        title = TITLE_TEXT_PATTERN.search(p.group())
+        if url and code and length and title:
+            yield 'Title', (url.group(), code.group(), length.group(), title.group())
+
+    # 处理 WeakPasswd
+    p = WEAKPASSWD_PATTERN.search(line)
+    if p:
+        ip = IP_PATTERN.search(line)
+        if ip:
+            details = p.group(1).split(":")
+            server = details[0]
+            passwd = details[3] if len(details) > 3 else ''
+            yield 'WeakPasswd', (ip.group(), server, passwd)
+
+    # 处理 Finger
+    if 'InfoScan' in line:
+        url = URL_PATTERN.search(line)
+        if url:
+            yield 'Finger', (url.group(), line.split(url.group())[-1].strip())
+
+    # 处理 NetBios
+    if "NetBios" in line:
+        ip = IP_PATTERN.search(line)
+        if ip:
+            yield 'NetBios', (ip.group(), line.split("NetBios")[-1].strip())
+
+
+class _NetInfoParser:
+    # NetInfo 跨多行: NetInfo 行、下一行 (IP), 然后是一行或多行 [->], 逐行喂入识别
+
+    def __init__(self):
+        self.block = []
+        self.arrows = []
+
+    def feed(self, line):
+        record = None
+        if len(self.block) == 2:
+            if '[->]' in line:
+                self.arrows.append(line)
+                return None
+            if self.arrows:
+                record = self.finish()
+            else:
+                # NetInfo 行后面没有 [->], 从第二行开始重新识别
+                second = self.block[1]
+                self.block = []
+                self.feed(second)
+        if len(self.block) == 1:
+            self.block.append(line)
+        elif 'NetInfo' in line:
+            self.block = [line]
+        return record
+
+    def finish(self):
+        block, arrows = self.block, self.arrows
+        self.block, self.arrows = [], []
+        if not arrows:
+            return None
+        lines = block + arrows
+        ip = NETINFO_IP_PATTERN.search('\n'.join(lines))
+        if not ip:
+            return None
+        # 从第一个含 [->] 的行开始取连续的 [->] 行, 除首行外每行前带换行
+        first = next(i for i, line in enumerate(lines) if '[->]' in line)
+        run = [lines[first]]
+        for line in lines[first + 1:]:
+            if '[->]' not in line:
+                break
+            run.append(line)
+        netinfo = ('\n' if first else '') + '\n'.join(run)
+        return 'NetInfo', (ip.group(1), netinfo)
+
+
+def iter_fscan_records(fscan_data):
+    """逐行解析 fscan 输出, 产出 (分类, 字段元组)。fscan_data 可以是字符串, 也可以是按行迭代的对象"""
+    lines = iter_text_lines(fscan_data) if isinstance(fscan_data, str) else fscan_data
+    netinfo = _NetInfoParser()
+    for line in lines:
+        line = line.rstrip('\n')
+        record = netinfo.feed(line)
+        if record:
+            yield record
+        yield from _parse_line(line.strip())
+
+    record = netinfo.finish()
+    if record:
+        yield record
+
+
+def process_fscan_data_compact(fscan_data, store=None, rollup=None):
+    """解析 fscan 输出到紧凑的 FscanStore 中, 传入 rollup 时同时按主机汇总"""
+    if store is None:
+        store = FscanStore()
+    for category, fields in iter_fscan_records(fscan_data):
+        store.add(category, fields)
+        if rollup is not None:
+            rollup.add(category, fields)
+    return store
+
+
+def process_fscan_data(fscan_data, rollup=None):
+    # 返回与原来相同的 {分类: [[表头], [行], ...]} 结构, 行在访问时才从紧凑存储中生成
+    return process_fscan_data_compact(fscan_data, rollup=rollup).as_lists()
+
+
+def parse_lines(lines):
+    """注册表使用的统一结构: 分类、IP/URL, 其余字段合并为详情"""
+    for category, fields in iter_fscan_records(lines):
+        yield {'category': category, 'target': fields[0], 'detail': ' '.join(fields[1:])}
+
+
+def sniff(sample):
+    return sniff_ratio(sample, lambda line: bool(
+        line.startswith(('[*]', '[+]', '[->]', 'start ')) or IP_PORT_PATTERN.match(line)))
+
+
+register(ParserSpec(
+    'fscan', 'Fscan',
+    columns=(
+        ('category', '分类', str),
+        ('target', 'IP/URL', str),
+        ('detail', '详情', str),
+    ),
+    sniff=sniff,
+    parse=parse_lines,
+    patterns={'ip': IP_PATTERN, 'title': TITLE_PATTERN, 'weak_passwd': WEAKPASSWD_PATTERN},
+    value_field='category',
+    text_field='target',
+))
 
 
 def get_encoding(file):
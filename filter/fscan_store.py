@@ -0,0 +1,230 @@
+# coding: utf-8
+"""
+Description: fscan 结果的紧凑存储。IPv4 打包为 32 位整数存放在 array('I') 中, 端口存放在 array('H') 中,
+             其余字符串 (服务名、OS、标题等) 驻留到字符串表里, 只保存下标。
+             大网段扫描 (如 /16) 时, 相比每条结果一个 [ip, port] 列表, 内存占用大幅下降。
+
+原来的 list-of-lists 结构通过 LazyRows 按需生成, 第 0 行仍然是表头。
+"""
+
+from array import array
+
+# 每个分类的表头和列类型: ip 打包为整数, port 为 16 位整数, str 驻留到字符串表
+FSCAN_SCHEMA = {
+    'OpenPort': (('IP', 'ip'), ('Port', 'port')),
+    'OsList': (('IP', 'ip'), ('OS', 'str')),
+    'Bug_ExpList': (('IP', 'ip'), ('Bug Exp', 'str')),
+    'Bug_PocList': (('URL', 'str'), ('Bug Poc', 'str')),
+    'Title': (('URL', 'str'), ('Code', 'str'), ('Length', 'str'), ('Title', 'str')),
+    'WeakPasswd': (('IP', 'ip'), ('Server', 'str'), ('Password', 'str')),
+    'Finger': (('URL', 'str'), ('Finger', 'str')),
+    'NetInfo': (('IP', 'ip'), ('Netinfo', 'str')),
+    'NetBios': (('IP', 'ip'), ('NetBios', 'str')),
+}
+
+_TYPECODES = {'ip': 'I', 'port': 'H', 'str': 'I'}
+
+
+def pack_ipv4(ip):
+    """把点分十进制的 IPv4 转为整数, 不能无损还原的写法 (如 010.1.1.1、999.1.1.1) 返回 None"""
+    parts = ip.split('.')
+    if len(parts) != 4:
+        return None
+    value = 0
+    for part in parts:
+        if not (part.isascii() and part.isdigit()) or (len(part) > 1 and part[0] == '0'):
+            return None
+        octet = int(part)
+        if octet > 255:
+            return None
+        value = (value << 8) | octet
+    return value
+
+
+def unpack_ipv4(value):
+    return f"{value >> 24}.{(value >> 16) & 255}.{(value >> 8) & 255}.{value & 255}"
+
+
+def _pack_port(port):
+    if not (port.isascii() and port.isdigit()) or (len(port) > 1 and port[0] == '0'):
+        return None
+    value = int(port)
+    return value if value <= 65535 else None
+
+
+class StringTable:
+    """字符串驻留表, 相同的字符串只保存一份"""
+
+    __slots__ = ('_index', '_strings')
+
+    def __init__(self):
+        self._index = {}
+        self._strings = []
+
+    def intern(self, value):
+        index = self._index.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._index[value] = index
+            self._strings.append(value)
+        return index
+
+    def __getitem__(self, index):
+        return self._strings[index]
+
+    def __len__(self):
+        return len(self._strings)
+
+
+class CompactTable:
+    """一个分类的列式存储, 每列是一个 array, 无法打包的 IP / 端口原样放在 overflow 中"""
+
+    __slots__ = ('name', 'header', 'kinds', 'columns', 'overflow', 'strings')
+
+    def __init__(self, name, schema, strings):
+        self.name = name
+        self.header = [column for column, _ in schema]
+        self.kinds = tuple(kind for _, kind in schema)
+        self.columns = tuple(array(_TYPECODES[kind]) for kind in self.kinds)
+        self.overflow = tuple({} for _ in self.kinds)
+        self.strings = strings
+
+    def append(self, fields):
+        row = len(self.columns[0])
+        for kind, column, overflow, value in zip(self.kinds, self.columns, self.overflow, fields):
+            if kind == 'str':
+                column.append(self.strings.intern(value))
+                continue
+            packed = pack_ipv4(value) if kind == 'ip' else _pack_port(value)
+            if packed is None:
+                overflow[row] = value
+                packed = 0
+            column.append(packed)
+
+    def value(self, row, col):
+        kind = self.kinds[col]
+        packed = self.columns[col][row]
+        if kind == 'str':
+            return self.strings[packed]
+        overflow = self.overflow[col]
+        if overflow and row in overflow:
+            return overflow[row]
+        return unpack_ipv4(packed) if kind == 'ip' else str(packed)
+
+    def row(self, row):
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(f"{self.name} row index out of range")
+        return [self.value(row, col) for col in range(len(self.kinds))]
+
+    def record(self, row):
+        return FscanRecord(self, row)
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield FscanRecord(self, row)
+
+
+class FscanRecord:
+    """单条结果的只读视图, 访问时才从列中取值"""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def category(self):
+        return self._table.name
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self._table.header.index(key)
+        elif key < 0:
+            key += len(self._table.kinds)
+        if not 0 <= key < len(self._table.kinds):
+            raise IndexError("column index out of range")
+        return self._table.value(self._row, key)
+
+    def __len__(self):
+        return len(self._table.kinds)
+
+    def __iter__(self):
+        for col in range(len(self._table.kinds)):
+            yield self._table.value(self._row, col)
+
+    def get(self, name, default=None):
+        if name not in self._table.header:
+            return default
+        return self[name]
+
+    def as_list(self):
+        return list(self)
+
+    def as_dict(self):
+        return dict(zip(self._table.header, self))
+
+    def __repr__(self):
+        return f"FscanRecord({self._table.name}, {self.as_list()!r})"
+
+
+class LazyRows:
+    """兼容原来的 [[表头], [行], ...] 结构, 下标访问时才生成对应的行列表"""
+
+    __slots__ = ('_table',)
+
+    def __init__(self, table):
+        self._table = table
+
+    def __len__(self):
+        return len(self._table) + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index == 0:
+            return list(self._table.header)
+        return self._table.row(index - 1)
+
+    def __iter__(self):
+        yield list(self._table.header)
+        for row in range(len(self._table)):
+            yield self._table.row(row)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyRows)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class FscanStore:
+    """按分类保存 fscan 结果, 所有分类共用一个字符串表"""
+
+    def __init__(self):
+        self.strings = StringTable()
+        self.tables = {name: CompactTable(name, schema, self.strings) for name, schema in FSCAN_SCHEMA.items()}
+
+    def add(self, category, fields):
+        self.tables[category].append(fields)
+
+    def __getitem__(self, category):
+        return self.tables[category]
+
+    def items(self):
+        return self.tables.items()
+
+    def counts(self):
+        return {name: len(table) for name, table in self.tables.items()}
+
+    def as_lists(self):
+        return {name: LazyRows(table) for name, table in self.tables.items()}
@@ -0,0 +1,83 @@
+import re
+
+from filter.registry import ParserSpec, register, sniff_ratio
+from filter.urlnorm import join_url, normalize_url, resolve_redirect, scheme_end
+
+# /admin                (Status: 301) [Size: 169] [--> http://127.0.0.1/admin/]
+RESULT_PATTERN = re.compile(r'^(\S+)\s+\(Status:\s*(\d{3})\)(?:\s*\[Size:\s*(\d+)\])?(?:\s*\[-->\s*([^\]\s]+)\s*\])?')
+URL_PATTERN = re.compile(r'^\[\+\]\s*Url:\s+(\S+)')
+ANSI_PATTERN = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+
+
+def parse_lines(lines, state=None):
+    """
+    逐行解析 gobuster dir 的终端输出和 -o 文件, 产出记录字典
+    分批解析时传入同一个 state 字典, 前一批中的 [+] Url: 目标地址保存在其中
+    """
+    state = {} if state is None else state
+    target_url = state.get('target_url', '')
+    for line in lines:
+        line = ANSI_PATTERN.sub('', line).strip()
+        match = RESULT_PATTERN.match(line)
+        if not match:
+            match = URL_PATTERN.match(line)
+            if match:
+                target_url = state['target_url'] = match.group(1)
+            continue
+
+        path = match.group(1)
+        if scheme_end(path) >= 0:
+            url = normalize_url(path)
+        elif target_url:
+            # gobuster 把路径拼接在目标地址之后, 不按 urljoin 的规则替换最后一级
+            url = join_url(target_url.rstrip('/') + '/', path.lstrip('/'))
+        else:
+            url = ''
+        yield {
+            'status_code': match.group(2),
+            'bytes': int(match.group(3)) if match.group(3) else 0,
+            'path': path,
+            'redirect_url': resolve_redirect(url, match.group(4)),
+            'url': url,
+        }
+
+
+def sniff(sample):
+    return sniff_ratio(sample, lambda line: bool(
+        RESULT_PATTERN.match(ANSI_PATTERN.sub('', line)) or
+        line.startswith(('[+] ', '=====', 'Gobuster', 'Starting gobuster', 'Finished', 'by OJ Reeves'))))
+
+
+register(ParserSpec(
+    'gobuster', 'Gobuster',
+    columns=(
+        ('status_code', '状态码', str),
+        ('bytes', '响应大小', int),
+        ('path', '路径', str),
+        ('redirect_url', '跳转路径', str),
+        ('url', '完整路径', str),
+    ),
+    sniff=sniff,
+    parse=parse_lines,
+    patterns={'result': RESULT_PATTERN, 'url': URL_PATTERN},
+    value_field='status_code',
+    text_field='path',
+    size_field='bytes',
+    stateful=True,
+))
+
+
+if __name__ == '__main__':
+    output_data = """
+===============================================================
+[+] Url:                     http://127.0.0.1
+[+] Method:                  GET
+===============================================================
+/admin                (Status: 301) [Size: 169] [--> http://127.0.0.1/admin/]
+/index.php            (Status: 200) [Size: 2048]
+/server-status        (Status: 403) [Size: 277]
+===============================================================
+    """
+
+    for entry in parse_lines(output_data.splitlines()):
+        print(entry)
@@ -0,0 +1,654 @@
+# coding: utf-8
+"""
+Description: 扫描结果接收服务。扫描编排器可以在扫描进行时通过 localhost HTTP 或 Unix socket
+             推送 dirsearch、Feroxbuster、fscan 的输出, 服务端按行增量调用 filter/* 中的过滤逻辑,
+             并通过查询接口返回过滤结果和汇总数据。
+
+接口 (两种监听方式使用同一套 HTTP 接口):
+    POST /ingest/<格式>?stream=<id>&<过滤参数>   请求体为扫描输出, 支持 chunked, 格式见 filter.registry
+    GET  /results?tool=<格式>&stream=<id>&status=<状态码/等级>&category=<fscan分类>&offset=0&limit=1000
+         &view=largest|rare_status|rare_signature|sample&n=100        结果太多时只取 Top N / 抽样
+    GET  /stats
+    GET  /summary?tool=<tool>                                            按主机汇总
+
+过滤参数:
+    dirsearch   status=200,301  min_size=  max_size=  unit=B|KB|MB|GB  path=<正则>
+    feroxbuster status=  method=GET,POST  min_lines= max_lines= min_words= max_words=
+                min_bytes= max_bytes=  path=<正则>
+    fscan       无, 查询时可按 category 筛选
+    其他格式    status=<状态码或等级>  min_size= max_size= (字节)  path=<正则>
+
+用法:
+    python -m filter.ingest serve --port 8765
+    python -m filter.ingest serve --unix /tmp/corgi.sock
+    python -m filter.ingest bench --streams 300 --lines 5000
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import time
+from urllib.parse import urlsplit, parse_qsl
+
+from filter.dirsearch import filter as dirsearch_filter, find_target, UNIT_MULTIPLIER  # dirsearch 处理
+from filter.feroxbuster import filter_response_data  # Feroxbuster 处理
+from filter.fscan import iter_fscan_records  # fscan 处理
+from filter.fscan_store import FSCAN_SCHEMA
+from filter.registry import get_parser, iter_text_lines
+from filter.topk import VIEW_MODES, select_view
+from filter.urlnorm import join_url, resolve_redirect
+from filter.aggregate import FscanRollup, WebRollup  # 按主机汇总
+
+TOOLS = ('dirsearch', 'feroxbuster', 'fscan')
+
+READ_CHUNK = 64 * 1024  # 每次从连接读取的字节数
+BATCH_LINES = 2000  # 每批交给过滤函数处理的行数
+QUEUE_SIZE = 8  # 每个流最多排队的批次数, 队列满时暂停读取连接 (背压)
+MAX_RESULTS = 1000000  # 保存的结果条数上限, 超出后只计数不保存
+MAX_LIMIT = 100000  # 单次查询最多返回的条数
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _split_list(value):
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+
+def _number(params, name, cast=int):
+    value = params.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        raise RequestError(400, f"{name} must be a number.")
+
+
+def _check_regex(path_regex):
+    if path_regex:
+        try:
+            re.compile(path_regex)
+        except re.error as e:
+            raise RequestError(400, f"path is not a valid regex: {e}")
+    return path_regex or None
+
+
+def _fscan_cut(lines):
+    # NetInfo 信息跨多行 (NetInfo 行、IP 行, 然后若干 [->] 行), 不能从中间切开, 留到下一批处理
+    cut = len(lines)
+    while cut > 0 and '[->]' in lines[cut - 1]:
+        cut -= 1
+    if cut >= 1 and 'NetInfo' in lines[cut - 1]:
+        cut -= 1
+    elif cut >= 2 and 'NetInfo' in lines[cut - 2]:
+        cut -= 2
+    return cut
+
+
+class IngestStream:
+    """一个扫描输出流, 保存过滤参数和计数, 同一个 stream id 可以分多次推送"""
+
+    def __init__(self, stream_id, tool, params, rollup, spec=None):
+        self.stream_id = stream_id
+        self.tool = tool
+        self.rollup = rollup
+        self.spec = spec
+        self.value_field = spec.value_field if spec else 'status_code'
+        self.target_url = ''
+        self.parse_state = {}  # 注册表格式跨批次的解析上下文
+        self.lines = 0
+        self.bytes = 0
+        self.records = 0
+        self.connections = 0
+        self.started = time.time()
+        self.updated = self.started
+
+        if tool == 'dirsearch':
+            self.run = self._setup_dirsearch(params)
+        elif tool == 'feroxbuster':
+            self.run = self._setup_feroxbuster(params)
+        elif tool == 'fscan':
+            self.run = self._run_fscan
+        else:
+            self.run = self._setup_registry(params)
+
+    def _setup_dirsearch(self, params):
+        status_codes = _split_list(params.get('status', ''))
+        min_size = _number(params, 'min_size', float)
+        max_size = _number(params, 'max_size', float)
+        unit = params.get('unit', 'B').upper()
+        size_filter = (min_size, max_size, unit) if min_size is not None or max_size is not None else None
+        path_regex = _check_regex(params.get('path', ''))
+
+        # 用空数据调用一次, 让 dirsearch 的参数校验在开始接收前生效
+        try:
+            dirsearch_filter('', status_codes, size_filter, path_regex)
+        except ValueError as e:
+            raise RequestError(400, str(e))
+
+        def run(text):
+            if not self.target_url:
+                self.target_url = find_target(iter_text_lines(text))
+
+            records = []
+            for time_, status, size, unit_, path, redirect_path in dirsearch_filter(text, status_codes, size_filter, path_regex):
+                url = join_url(self.target_url, path)
+                size_bytes = int(size) * UNIT_MULTIPLIER[unit_]
+                records.append({
+                    'time': time_,
+                    'status_code': status,
+                    'size': size,
+                    'unit': unit_,
+                    'bytes': size_bytes,
+                    'path': path,
+                    'redirect_url': resolve_redirect(url, redirect_path),
+                    'url': url,
+                })
+                self.rollup.add(url, status, size_bytes)
+            return records
+
+        return run
+
+    def _setup_feroxbuster(self, params):
+        kwargs = {
+            'status_codes': _split_list(params.get('status', '')),
+            'methods': [m.upper() for m in _split_list(params.get('method', ''))],
+            'line_count': (_number(params, 'min_lines'), _number(params, 'max_lines')),
+            'word_count': (_number(params, 'min_words'), _number(params, 'max_words')),
+            'byte_count': (_number(params, 'min_bytes'), _number(params, 'max_bytes')),
+            'path_regex': _check_regex(params.get('path', '')),
+            'rollup': self.rollup,
+        }
+
+        def run(text):
+            return filter_response_data(text, **kwargs)
+
+        return run
+
+    def _run_fscan(self, text):
+        # 直接使用逐行解析的结果, 不经过紧凑存储再还原成行
+        records = []
+        for category, fields in iter_fscan_records(text):
+            self.rollup.add(category, fields)
+            record = {column: value for (column, _), value in zip(FSCAN_SCHEMA[category], fields)}
+            record['category'] = category
+            records.append(record)
+        return records
+
+    def _setup_registry(self, params):
+        # 注册表中的其他格式使用通用过滤
+        spec = self.spec
+        values = _split_list(params.get('status', ''))
+        path_regex = _check_regex(params.get('path', ''))
+        size_range = (_number(params, 'min_size'), _number(params, 'max_size'))
+
+        def run(text):
+            lines = iter_text_lines(text)
+            # 每批都会新建解析器, 目标地址之类的上下文通过 parse_state 延续到下一批
+            parsed = spec.parse(lines, self.parse_state) if spec.stateful else spec.parse(lines)
+            records = list(spec.filter(parsed, values, path_regex, size_range))
+            if self.rollup is not None:
+                for record in records:
+                    self.rollup.add(record['url'], record['status_code'], record['bytes'])
+            return records
+
+        return run
+
+    def cut(self, lines):
+        if self.tool == 'fscan':
+            return _fscan_cut(lines)
+        if self.spec is not None and not self.spec.streaming:
+            # 整个文档才能解析的格式 (如 ffuf 的 JSON), 收完再处理
+            return 0
+        return len(lines)
+
+    def info(self):
+        return {
+            'stream': self.stream_id,
+            'tool': self.tool,
+            'target': self.target_url,
+            'lines': self.lines,
+            'bytes': self.bytes,
+            'records': self.records,
+            'active': self.connections > 0,
+            'started': self.started,
+            'updated': self.updated,
+        }
+
+
+class IngestServer:
+    def __init__(self, max_results=MAX_RESULTS, batch_lines=BATCH_LINES, queue_size=QUEUE_SIZE):
+        self.max_results = max_results
+        self.batch_lines = batch_lines
+        self.queue_size = queue_size
+
+        self.streams = {}
+        self.results = {tool: [] for tool in TOOLS}
+        self.stored = 0
+        self.dropped = 0
+
+        # 汇总计数, 在写入结果时累加, 查询时不再遍历结果
+        self.record_counts = {tool: 0 for tool in TOOLS}
+        self.status_counts = {'dirsearch': {}, 'feroxbuster': {}}
+        self.category_counts = {}
+        self.rollups = {'dirsearch': WebRollup(), 'feroxbuster': WebRollup(), 'fscan': FscanRollup()}
+        self._servers = []
+        self._stream_seq = 0
+
+    async def start(self, host='127.0.0.1', port=8765, unix_path=None):
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle, path=unix_path, limit=READ_CHUNK, backlog=1024)
+        else:
+            server = await asyncio.start_server(self.handle, host, port, limit=READ_CHUNK, backlog=1024)
+        self._servers.append(server)
+        return server
+
+    async def close(self):
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+
+    async def handle(self, reader, writer):
+        try:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+
+            request_line, *header_lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, target, _ = request_line.split(' ', 2)
+            except ValueError:
+                await self._respond(writer, 400, {'error': 'bad request line'})
+                return
+            headers = {}
+            for line in header_lines:
+                if line:
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+            url = urlsplit(target)
+            params = dict(parse_qsl(url.query, keep_blank_values=True))
+            parts = [p for p in url.path.split('/') if p]
+
+            try:
+                if parts[:1] == ['ingest'] and len(parts) == 2:
+                    if method != 'POST':
+                        raise RequestError(405, 'use POST to ingest data')
+                    if headers.get('expect', '').lower() == '100-continue':
+                        writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+                    payload = await self._ingest(reader, headers, parts[1], params)
+                elif parts == ['results'] and method == 'GET':
+                    payload = self.query(params)
+                elif parts == ['stats'] and method == 'GET':
+                    payload = self.stats()
+                elif parts == ['summary'] and method == 'GET':
+                    payload = self.summary(params)
+                else:
+                    raise RequestError(404, f"no route for {method} {url.path}")
+            except RequestError as e:
+                await self._respond(writer, e.status, {'error': str(e)})
+                return
+            await self._respond(writer, 200, payload)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _spec(self, tool):
+        # 三种原有格式使用各自的过滤函数, 其余格式来自注册表
+        if tool in TOOLS:
+            return None
+        try:
+            spec = get_parser(tool)
+        except ValueError as e:
+            raise RequestError(404, str(e))
+        if tool not in self.results:
+            self.results[tool] = []
+            self.record_counts[tool] = 0
+            self.status_counts[tool] = {}
+            web = {'url', 'status_code', 'bytes'} <= set(spec.keys)
+            self.rollups[tool] = WebRollup() if web else None
+        return spec
+
+    def _tools(self, params):
+        if not params.get('tool'):
+            return list(self.results)
+        tool = params['tool']
+        self._spec(tool)
+        return [tool]
+
+    async def _ingest(self, reader, headers, tool, params):
+        spec = self._spec(tool)
+
+        stream_id = params.get('stream')
+        if not stream_id:
+            self._stream_seq += 1
+            stream_id = f"{tool}-{self._stream_seq}"
+        stream = self.streams.get(stream_id)
+        if stream is None:
+            stream = IngestStream(stream_id, tool, params, self.rollups[tool], spec)
+            self.streams[stream_id] = stream
+        elif stream.tool != tool:
+            raise RequestError(400, f"stream {stream_id} is a {stream.tool} stream")
+
+        # 读取与解析分开: 队列满时读取协程阻塞在 put 上, 不再从连接读取, 由 TCP 把压力传回发送方
+        queue = asyncio.Queue(self.queue_size)
+        consumer = asyncio.create_task(self._consume(stream, queue))
+        stream.connections += 1
+        lines_before = stream.lines
+        records_before = stream.records
+        try:
+            remainder = b''
+            batch = []
+            async for chunk in self._iter_body(reader, headers):
+                stream.bytes += len(chunk)
+                *complete, remainder = (remainder + chunk).split(b'\n')
+                for line in complete:
+                    batch.append(line.rstrip(b'\r').decode('utf-8', 'replace'))
+                if len(batch) >= self.batch_lines:
+                    stream.lines += len(batch)
+                    await queue.put(batch)
+                    batch = []
+            if remainder:
+                batch.append(remainder.rstrip(b'\r').decode('utf-8', 'replace'))
+            if batch:
+                stream.lines += len(batch)
+                await queue.put(batch)
+            await queue.put(None)
+            error = await consumer
+        finally:
+            stream.connections -= 1
+            stream.updated = time.time()
+            if not consumer.done():
+                consumer.cancel()
+
+        if error is not None:
+            raise RequestError(500, f"failed to process {tool} data: {error}")
+        return {
+            'stream': stream.stream_id,
+            'tool': tool,
+            'lines': stream.lines - lines_before,
+            'records': stream.records - records_before,
+        }
+
+    async def _iter_body(self, reader, headers):
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size_line = await reader.readline()
+                try:
+                    size = int(size_line.split(b';')[0].strip(), 16)
+                except ValueError:
+                    raise RequestError(400, 'bad chunk size')
+                if size == 0:
+                    # 丢弃 trailer
+                    while (await reader.readline()).strip():
+                        pass
+                    return
+                while size > 0:
+                    data = await reader.readexactly(min(size, READ_CHUNK))
+                    size -= len(data)
+                    yield data
+                await reader.readline()
+        else:
+            try:
+                remaining = int(headers.get('content-length', '0'))
+            except ValueError:
+                raise RequestError(400, 'bad content-length')
+            while remaining > 0:
+                data = await reader.read(min(remaining, READ_CHUNK))
+                if not data:
+                    return
+                remaining -= len(data)
+                yield data
+
+    async def _consume(self, stream, queue):
+        # 出错后继续取走队列中的批次, 保证读取协程不会阻塞在 put 上
+        pending = []
+        error = None
+        while True:
+            batch = await queue.get()
+            if error is not None:
+                if batch is None:
+                    return error
+                continue
+            try:
+                if batch is None:
+                    if pending:
+                        self._store(stream, stream.run('\n'.join(pending)))
+                    return None
+                pending.extend(batch)
+                cut = stream.cut(pending)
+                if cut:
+                    self._store(stream, stream.run('\n'.join(pending[:cut])))
+                    pending = pending[cut:]
+            except Exception as e:
+                error = e
+                if batch is None:
+                    return error
+            # 每批处理完让出事件循环, 避免单个大流饿死其他连接
+            await asyncio.sleep(0)
+
+    def _store(self, stream, records):
+        tool = stream.tool
+        stream.records += len(records)
+        stream.updated = time.time()
+        self.record_counts[tool] += len(records)
+
+        if tool == 'fscan':
+            counts = self.category_counts
+            for record in records:
+                counts[record['category']] = counts.get(record['category'], 0) + 1
+        else:
+            counts = self.status_counts[tool]
+            field = stream.value_field
+            for record in records:
+                counts[record[field]] = counts.get(record[field], 0) + 1
+
+        room = self.max_results - self.stored
+        if room < len(records):
+            self.dropped += len(records) - max(room, 0)
+            records = records[:max(room, 0)]
+        for record in records:
+            record['stream'] = stream.stream_id
+        self.results[tool].extend(records)
+        self.stored += len(records)
+
+    def query(self, params):
+        tools = self._tools(params)
+        offset = _number(params, 'offset') or 0
+        limit = _number(params, 'limit')
+        limit = 1000 if limit is None else min(limit, MAX_LIMIT)
+
+        view = params.get('view')
+        if view and view not in dict(VIEW_MODES):
+            raise RequestError(400, f"view must be one of: {', '.join(m for m, _ in VIEW_MODES)}")
+        matched = self._match(tools, params)
+
+        # view=all 与不指定相同, 按 offset / limit 分页, 不能绕过 MAX_LIMIT
+        if view and view != 'all':
+            n = _number(params, 'n')
+            n = 100 if n is None else min(n, MAX_LIMIT)
+            # Top N / 抽样只遍历一次, 总数和状态码分布仍是精确值
+            rows, stats = select_view(
+                matched, view, n,
+                size_key=lambda r: r[1].get('bytes') or 0,
+                status_key=lambda r: str(r[1].get(r[2])),
+                signature_key=lambda r: (str(r[1].get(r[2])), r[1].get('bytes'), r[1].get('words'), r[1].get('lines')),
+            )
+            return {
+                'total': stats['total'],
+                'view': view,
+                'stats': stats,
+                'results': [dict(record, tool=tool) for tool, record, _ in rows],
+            }
+
+        total = 0
+        results = []
+        for tool, record, _ in matched:
+            if offset <= total < offset + limit:
+                results.append(dict(record, tool=tool))
+            total += 1
+
+        return {'total': total, 'offset': offset, 'results': results}
+
+    def _match(self, tools, params):
+        stream_id = params.get('stream')
+        status_codes = set(_split_list(params.get('status', '')))
+        category = params.get('category')
+
+        for tool in tools:
+            spec = self._spec(tool)
+            field = spec.value_field if spec else ('category' if tool == 'fscan' else 'status_code')
+            for record in self.results[tool]:
+                if stream_id and record['stream'] != stream_id:
+                    continue
+                if status_codes and str(record.get(field)) not in status_codes:
+                    continue
+                if category and record.get('category') != category:
+                    continue
+                yield tool, record, field
+
+    def stats(self):
+        return {
+            'records': self.record_counts,
+            'stored': self.stored,
+            'dropped': self.dropped,
+            'status_codes': self.status_counts,
+            'fscan_categories': self.category_counts,
+            'streams': [stream.info() for stream in self.streams.values()],
+        }
+
+    def summary(self, params):
+        payload = {}
+        for tool in self._tools(params):
+            if self.rollups[tool] is None:
+                continue
+            rows = self.rollups[tool].rows()
+            payload[tool] = [dict(zip(rows[0], row)) for row in rows[1:]]
+        return payload
+
+    @staticmethod
+    async def _respond(writer, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n")
+        writer.write(head.encode('ascii') + body)
+        await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=8765, unix_path=None):
+    ingest_server = IngestServer()
+    server = await ingest_server.start(host, port, unix_path)
+    where = unix_path or f"http://{host}:{port}"
+    print(f"接收服务已启动: {where}")
+    async with server:
+        await server.serve_forever()
+
+
+# ---------------------------------------------------------------- 压测用的本地负载生成器
+
+def _bench_lines(tool, index, count):
+    if tool == 'dirsearch':
+        return [f"[09:45:{n % 60:02d}] {(200, 301, 403, 404)[n % 4]} -  {n % 900}KB - /dir{index}/file{n}.php"
+                for n in range(count)]
+    if tool == 'feroxbuster':
+        return [f"{(200, 301, 403, 404)[n % 4]}      GET        {n % 50}l       {n % 300}w      {n % 9000}c "
+                f"http://10.{index // 256 % 256}.{index % 256}.1/path{n}" for n in range(count)]
+    return [f"10.{index // 256 % 256}.{index % 256}.{n % 256}:{n % 65535 + 1} open" for n in range(count)]
+
+
+async def _open(host, port, unix_path):
+    if unix_path:
+        return await asyncio.open_unix_connection(unix_path)
+    return await asyncio.open_connection(host, port)
+
+
+async def _bench_stream(host, port, unix_path, tool, index, lines, chunk_lines):
+    reader, writer = await _open(host, port, unix_path)
+    writer.write((f"POST /ingest/{tool}?stream=bench-{index} HTTP/1.1\r\n"
+                  f"Host: {host}\r\nTransfer-Encoding: chunked\r\n\r\n").encode('ascii'))
+    data = _bench_lines(tool, index, lines)
+    for start in range(0, len(data), chunk_lines):
+        chunk = ('\n'.join(data[start:start + chunk_lines]) + '\n').encode('utf-8')
+        writer.write(f"{len(chunk):x}\r\n".encode('ascii') + chunk + b'\r\n')
+        await writer.drain()
+    writer.write(b'0\r\n\r\n')
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response.split(b'\r\n\r\n', 1)[-1]
+
+
+async def _fetch(host, port, unix_path, path):
+    reader, writer = await _open(host, port, unix_path)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('ascii'))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return json.loads(response.split(b'\r\n\r\n', 1)[-1])
+
+
+async def bench(streams=300, lines=5000, tool='feroxbuster', chunk_lines=200, host=None, port=8765, unix_path=None):
+    # 未指定服务地址时在本进程内启动一个服务, 只用于粗略评估吞吐
+    local_server = None
+    if host is None and unix_path is None:
+        host = '127.0.0.1'
+        local_server = IngestServer()
+        server = await local_server.start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    sent_bytes = sum(len(line) + 1 for line in _bench_lines(tool, 0, lines)) * streams
+    begin = time.perf_counter()
+    await asyncio.gather(*(_bench_stream(host, port, unix_path, tool, i, lines, chunk_lines) for i in range(streams)))
+    elapsed = time.perf_counter() - begin
+    stats = await _fetch(host, port, unix_path, '/stats')
+
+    if local_server is not None:
+        await local_server.close()
+
+    total_lines = streams * lines
+    print(f"工具: {tool}  并发流: {streams}  每流行数: {lines}")
+    print(f"总行数: {total_lines}  耗时: {elapsed:.2f}s  "
+          f"吞吐: {total_lines / elapsed:,.0f} 行/s, {sent_bytes / elapsed / 1024 ** 2:.1f} MB/s")
+    print(f"结果数: {stats['records'][tool]}  已保存: {stats['stored']}  丢弃: {stats['dropped']}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="扫描结果接收服务")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = sub.add_parser('serve', help="启动接收服务")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--unix', help="监听 Unix socket 路径, 指定后忽略 host/port")
+
+    bench_parser = sub.add_parser('bench', help="用本地负载生成器压测")
+    bench_parser.add_argument('--streams', type=int, default=300)
+    bench_parser.add_argument('--lines', type=int, default=5000)
+    bench_parser.add_argument('--tool', choices=TOOLS, default='feroxbuster')
+    bench_parser.add_argument('--chunk-lines', type=int, default=200)
+    bench_parser.add_argument('--host', help="已有服务的地址, 不指定时在本进程内启动服务")
+    bench_parser.add_argument('--port', type=int, default=8765)
+    bench_parser.add_argument('--unix')
+
+    args = parser.parse_args()
+    if args.command == 'serve':
+        asyncio.run(serve(args.host, args.port, args.unix))
+    else:
+        asyncio.run(bench(args.streams, args.lines, args.tool, args.chunk_lines, args.host, args.port, args.unix))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+import json
+
+from filter.registry import ParserSpec, register, sniff_ratio
+
+
+def parse_lines(lines):
+    """逐行解析 nuclei -jsonl 输出, 兼容旧版本的 templateID / matched 字段"""
+    for line in lines:
+        line = line.strip()
+        if not line.startswith('{'):
+            continue
+        try:
+            result = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(result, dict):
+            continue
+
+        info = result.get('info') or {}
+        extracted = result.get('extracted-results') or result.get('extracted_results') or []
+        yield {
+            'severity': info.get('severity', ''),
+            'template_id': result.get('template-id') or result.get('templateID', ''),
+            'name': info.get('name', ''),
+            'type': result.get('type', ''),
+            'host': result.get('host', ''),
+            'matched_at': result.get('matched-at') or result.get('matched', ''),
+            'extracted': ', '.join(str(v) for v in extracted),
+        }
+
+
+def sniff(sample):
+    return sniff_ratio(sample, lambda line: line.startswith('{') and ('"template-id"' in line or '"templateID"' in line))
+
+
+register(ParserSpec(
+    'nuclei', 'Nuclei',
+    columns=(
+        ('severity', '等级', str),
+        ('template_id', '模板', str),
+        ('name', '名称', str),
+        ('type', '类型', str),
+        ('host', '主机', str),
+        ('matched_at', '命中地址', str),
+        ('extracted', '提取结果', str),
+    ),
+    sniff=sniff,
+    parse=parse_lines,
+    value_field='severity',
+    text_field='matched_at',
+))
+
+
+if __name__ == '__main__':
+    output_data = """
+{"template-id":"tech-detect","info":{"name":"Wappalyzer Technology Detection","severity":"info"},"type":"http","host":"http://127.0.0.1","matched-at":"http://127.0.0.1/","extracted-results":["nginx"]}
+{"template-id":"git-config","info":{"name":"Git Config File","severity":"medium"},"type":"http","host":"http://127.0.0.1","matched-at":"http://127.0.0.1/.git/config"}
+    """
+
+    for entry in parse_lines(output_data.splitlines()):
+        print(entry)
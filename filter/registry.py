@@ -0,0 +1,161 @@
+# coding: utf-8
+"""
+Description: 扫描结果格式注册表。每种格式声明预编译的正则、用于自动识别的 sniff 函数、
+             记录字段 (列) 以及逐行解析函数, 界面、接收服务都通过注册表使用这些格式,
+             新增扫描器只需要在 filter/ 下新建模块并调用 register()。
+
+    sniff(sample)   对输入开头的一小段文本打分 (0~1), 分数最高的格式即识别结果
+    parse(lines)    逐行解析, 产出记录字典, 字段与 columns 对应
+                    stateful 的格式还接受 parse(lines, state), 跨行的上下文 (如目标地址) 保存在
+                    state 字典中, 分批解析同一个输出时传入同一个字典
+"""
+
+import importlib
+import re
+
+BUILTIN_MODULES = (
+    'filter.dirsearch',
+    'filter.feroxbuster',
+    'filter.fscan',
+    'filter.ffuf',
+    'filter.gobuster',
+    'filter.nuclei',
+)
+
+SNIFF_BYTES = 64 * 1024  # 识别格式时只看开头这么多字符
+SNIFF_LINES = 200  # 识别格式时最多看的非空行数
+SNIFF_THRESHOLD = 0.3  # 低于这个分数认为无法识别
+
+_parsers = {}
+_loaded = False
+
+
+class ParserSpec:
+    """
+    一种扫描结果格式
+
+    columns       ((字段名, 表头, 类型), ...), 类型为 str 或 int
+    patterns      该格式用到的预编译正则, 便于其他模块复用
+    value_field   "值过滤" 使用的字段, 如状态码、漏洞等级
+    text_field    正则过滤使用的字段, 如 URL、路径
+    size_field    大小范围过滤使用的字段, 没有则为 None
+    streaming     是否可以按任意行切分后分批解析, 整个 JSON 文档之类的格式为 False
+    stateful      parse 是否接受 state 参数, 分批解析时需要由调用方保存上下文
+    """
+
+    def __init__(self, name, title, columns, sniff, parse, patterns=None, value_field=None,
+                 text_field=None, size_field=None, streaming=True, stateful=False):
+        self.name = name
+        self.title = title
+        self.columns = tuple(columns)
+        self.sniff = sniff
+        self.parse = parse
+        self.patterns = patterns or {}
+        self.value_field = value_field
+        self.text_field = text_field
+        self.size_field = size_field
+        self.streaming = streaming
+        self.stateful = stateful
+
+    @property
+    def keys(self):
+        return [key for key, _, _ in self.columns]
+
+    @property
+    def labels(self):
+        return [label for _, label, _ in self.columns]
+
+    def filter(self, records, values=None, path_regex=None, size_range=None):
+        return filter_records(records, self, values, path_regex, size_range)
+
+    def __repr__(self):
+        return f"ParserSpec({self.name!r})"
+
+
+def register(spec):
+    _parsers[spec.name] = spec
+    return spec
+
+
+def load_builtin():
+    # 内置格式的模块在导入时自行注册
+    global _loaded
+    if not _loaded:
+        _loaded = True
+        for module in BUILTIN_MODULES:
+            importlib.import_module(module)
+
+
+def get_parser(name):
+    load_builtin()
+    try:
+        return _parsers[name]
+    except KeyError:
+        raise ValueError(f"unknown format: {name}, expected one of: {', '.join(_parsers)}")
+
+
+def parsers():
+    load_builtin()
+    return list(_parsers.values())
+
+
+def detect(sample):
+    """根据输入开头的内容识别格式, 无法识别时返回 None"""
+    load_builtin()
+    sample = sample[:SNIFF_BYTES]
+    best, best_score = None, SNIFF_THRESHOLD
+    for spec in _parsers.values():
+        score = spec.sniff(sample)
+        if score > best_score:
+            best, best_score = spec, score
+    return best
+
+
+def iter_text_lines(text):
+    # 逐行切分, 不像 split('\n') 那样一次生成整个行列表
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def sniff_ratio(sample, predicate):
+    """sniff 的常用实现: 开头若干非空行中满足 predicate 的比例"""
+    total = hits = 0
+    for line in sample.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        total += 1
+        if predicate(line):
+            hits += 1
+        if total >= SNIFF_LINES:
+            break
+    return hits / total if total else 0.0
+
+
+def filter_records(records, spec, values=None, path_regex=None, size_range=None):
+    """
+    通用过滤, 逐条产出满足条件的记录
+    values      value_field 允许的取值列表, 如 ['200', '301']
+    path_regex  对 text_field 做不区分大小写的正则匹配
+    size_range  (最小, 最大) 对 size_field 做范围过滤, 任一端可以为 None
+    """
+    values = set(values) if values else None
+    pattern = re.compile(path_regex, re.IGNORECASE) if path_regex else None
+    min_size, max_size = size_range if size_range and spec.size_field else (None, None)
+
+    for record in records:
+        if values is not None and str(record.get(spec.value_field)) not in values:
+            continue
+        if pattern is not None and not pattern.search(record.get(spec.text_field) or ''):
+            continue
+        if min_size is not None or max_size is not None:
+            size = record.get(spec.size_field)
+            if size is None or (min_size is not None and size < min_size) or (max_size is not None and size > max_size):
+                continue
+        yield record
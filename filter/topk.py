@@ -0,0 +1,144 @@
+# coding: utf-8
+"""
+Description: 结果太多无法全部显示时的选取方式, 都只遍历一次结果:
+             最大的 N 条 (堆选取)、最罕见的状态码 / 字节特征、蓄水池随机抽样,
+             同时精确统计总数和状态码分布。
+"""
+
+import heapq
+import random
+from itertools import count
+
+VIEW_MODES = (
+    ('all', '全部'),
+    ('largest', '最大响应 Top N'),
+    ('rare_status', '最罕见状态码'),
+    ('rare_signature', '最罕见字节特征'),
+    ('sample', '随机抽样 N'),
+)
+
+
+class TopK:
+    """保留 key 最大的 k 条, 内存中最多 k 条"""
+
+    def __init__(self, k, key):
+        self.k = k
+        self.key = key
+        self._heap = []
+        self._seq = count()
+
+    def add(self, item):
+        if self.k <= 0:
+            return
+        entry = (self.key(item), next(self._seq), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[0] > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self):
+        # 从大到小, 相同大小按出现顺序
+        return [item for _, _, item in sorted(self._heap, key=lambda e: (e[0], -e[1]), reverse=True)]
+
+
+class Reservoir:
+    """蓄水池抽样, 等概率保留 k 条, 输出时保持原来的先后顺序"""
+
+    def __init__(self, k, seed=None):
+        self.k = k
+        self.seen = 0
+        self._items = []
+        self._random = random.Random(seed)
+
+    def add(self, item):
+        self.seen += 1
+        if len(self._items) < self.k:
+            self._items.append((self.seen, item))
+        else:
+            j = self._random.randrange(self.seen)
+            if j < self.k:
+                self._items[j] = (self.seen, item)
+
+    def items(self):
+        return [item for _, item in sorted(self._items, key=lambda e: e[0])]
+
+
+class RareKeys:
+    """按 key 精确计数, 每个 key 保留最先出现的几条, 结束后取出现次数最少的 key 对应的记录"""
+
+    def __init__(self, k, key, per_key=5):
+        self.k = k
+        self.key = key
+        self.per_key = per_key
+        self.counts = {}
+        self._samples = {}
+
+    def add(self, item):
+        value = self.key(item)
+        seen = self.counts.get(value, 0)
+        self.counts[value] = seen + 1
+        if seen < self.per_key:
+            self._samples.setdefault(value, []).append(item)
+
+    def rarest(self, n=None):
+        n = self.k if n is None else n
+        return heapq.nsmallest(n, self.counts.items(), key=lambda kv: kv[1])
+
+    def items(self):
+        # 先保证每个罕见的 key 至少有一条, 再轮流补足到 k 条, 输出时按罕见程度分组
+        keys = [value for value, _ in self.rarest()]
+        take = dict.fromkeys(keys, 0)
+        left = self.k
+        for round_ in range(self.per_key):
+            for value in keys:
+                if left and round_ < len(self._samples[value]):
+                    take[value] += 1
+                    left -= 1
+        return [item for value in keys for item in self._samples[value][:take[value]]]
+
+
+def select_view(records, mode, n, size_key=None, status_key=None, signature_key=None, seed=None):
+    """
+    遍历一次 records, 按 mode 选出要显示的记录
+    返回 (记录列表, 统计), 统计中的总数和状态码分布是精确值, 与选取方式无关
+    """
+    if mode == 'largest':
+        selector = TopK(n, size_key)
+    elif mode == 'rare_status':
+        selector = RareKeys(n, status_key)
+    elif mode == 'rare_signature':
+        selector = RareKeys(n, signature_key)
+    elif mode == 'sample':
+        selector = Reservoir(n, seed)
+    elif mode == 'all':
+        selector = None
+    else:
+        raise ValueError(f"mode must be one of: {', '.join(m for m, _ in VIEW_MODES)}")
+
+    rows = []
+    total = 0
+    status_counts = {}
+    for record in records:
+        total += 1
+        status = status_key(record)
+        status_counts[status] = status_counts.get(status, 0) + 1
+        if selector is None:
+            rows.append(record)
+        else:
+            selector.add(record)
+
+    stats = {'total': total, 'status': status_counts}
+    if isinstance(selector, RareKeys):
+        stats['distinct'] = len(selector.counts)
+        stats['rarest'] = selector.rarest(10)
+    return (rows if selector is None else selector.items()), stats
+
+
+def format_stats(stats, shown):
+    """界面上显示的统计说明"""
+    histogram = ' '.join(f"{code}:{n}" for code, n in sorted(stats['status'].items(), key=lambda kv: str(kv[0])))
+    text = f"共 {stats['total']} 条, 显示 {shown} 条; 状态码: {histogram}"
+    if 'rarest' in stats:
+        rarest = ' '.join(f"{'/'.join(map(str, v)) if isinstance(v, tuple) else v}({n})" for v, n in stats['rarest'])
+        text += f"; 不同取值 {stats['distinct']} 个, 最罕见: {rarest}"
+    return text
@@ -0,0 +1,99 @@
+# coding: utf-8
+"""
+Description: dirsearch / Feroxbuster 共用的 URL 规范化。同一批路径、不同大小写的百分号编码
+             和跳转目标在结果中反复出现, 拼接、规范化的结果用有界的 LRU 缓存, 每条结果的开销
+             与结果总数无关, 上千万行输入时缓存占用的内存也不会增长。
+
+    scheme_end(url)               协议后 :// 的位置, 相对路径返回 -1
+    normalize_url(url)            协议和主机转为小写, 路径、参数保持原样
+    join_url(base, path)          urljoin 后规范化, base 为空时原样返回 path
+    resolve_redirect(url, target) 跳转目标相对当前 URL 补全为完整 URL
+    dedup_key(url)                去重用的键, 在规范化的基础上统一百分号编码的大小写, 只解码非保留字符
+    split_redirect(text)          "路径 -> 跳转目标" 只切分一次
+"""
+
+import re
+import string
+from functools import lru_cache
+from urllib.parse import urljoin
+
+URL_CACHE_SIZE = 64 * 1024  # 每个缓存最多保留这么多条
+
+SCHEME_PATTERN = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*://')
+PERCENT_PATTERN = re.compile(r'%([0-9A-Fa-f]{2})')
+# RFC 3986 的非保留字符, 编码与否含义相同; 另外 %5C 与 \ 按同一路径处理
+DECODE_CHARS = frozenset(string.ascii_letters + string.digits + '-._~\\')
+
+
+def scheme_end(url):
+    # 只有开头是合法的协议名时 :// 才是协议分隔符, /r?u=http://x 之类的相对路径不算
+    match = SCHEME_PATTERN.match(url)
+    return match.end() - 3 if match else -1
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def normalize_url(url):
+    start = scheme_end(url)
+    if start < 0:
+        return url
+    # 与 aggregate.url_host 相同, 不用 urlsplit, 主机到第一个 / ? # 为止
+    end = len(url)
+    for sep in '/?#':
+        pos = url.find(sep, start + 3)
+        if 0 <= pos < end:
+            end = pos
+    netloc = url[start + 3:end]
+    userinfo, at, host = netloc.rpartition('@')
+    # 用户名密码区分大小写, 只转换主机部分
+    return url[:start].lower() + '://' + userinfo + at + host.lower() + url[end:]
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def join_url(base, path):
+    if not base:
+        return normalize_url(path)
+    return normalize_url(urljoin(base, path))
+
+
+def resolve_redirect(url, target):
+    if not target:
+        return ''
+    return join_url(url, target)
+
+
+def _percent(match):
+    char = chr(int(match.group(1), 16))
+    return char if char in DECODE_CHARS else '%' + match.group(1).upper()
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def dedup_key(url):
+    # /a%5c.aspx、/a%5C.aspx 和 /a\.aspx 视为同一个路径, 但 %2F、%3F、%23、%25 等保留字符仍保持编码,
+    # x%2Fy 与 x/y、..%2F 与 ../ 是不同的请求
+    return PERCENT_PATTERN.sub(_percent, normalize_url(url))
+
+
+def split_redirect(text, sep='->'):
+    path, _, target = text.partition(sep)
+    return path.strip(), target.strip()
+
+
+def unique(records, key):
+    """按 key 去重, 保留第一次出现的记录, 逐条产出"""
+    seen = set()
+    for record in records:
+        value = key(record)
+        if value in seen:
+            continue
+        seen.add(value)
+        yield record
+
+
+if __name__ == '__main__':
+    base = 'HTTP://Example.COM:8080/app/'
+    for path in ('/a%5c.aspx', '/a%5C.aspx', 'login', '../admin?x=A'):
+        url = join_url(base, path)
+        print(url, '->', dedup_key(url))
+    print(split_redirect('/reports  ->  /reports/'))
+    print(resolve_redirect('http://127.0.0.1/reports', '/reports/'))
+    print(join_url.cache_info())